@@ -0,0 +1,143 @@
+"""
+Measure Moniker's cold-start cost: the import time of moniker.py as
+reported by python -X importtime, and the wall time from process start to
+the first outbound request.
+
+The first request is captured by a local HTTP proxy which records the
+moment it receives a connection and then refuses it, so no request leaves
+the machine.
+
+Usage: python benchmarks/startup.py [--runs 5] [--budget 500] [--top 10]
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+
+
+def ImportTime(top: int) -> tuple[float, list[tuple[float, str]]]:
+    """
+    Import moniker with -X importtime and return its cumulative import time
+    (ms) alongside the slowest top-level imports.
+    """
+
+    proc: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import moniker"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    total: float = 0.0
+    modules: list[tuple[float, str]] = []
+
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+
+        # Imports made directly by moniker are indented by three spaces.
+        if name.startswith("   ") and not name.startswith("    "):
+            modules.append((int(cumulative) / 1000, name.strip()))
+
+        if name.strip() == "moniker":
+            total = int(cumulative) / 1000
+
+    return total, sorted(modules, reverse=True)[:top]
+
+
+def FirstRequest(timeout: float = 30.0) -> float:
+    """Start Moniker and return the milliseconds until its first request."""
+
+    with socket.socket() as proxy, tempfile.TemporaryDirectory() as tmp:
+        proxy.bind(("127.0.0.1", 0))
+        proxy.listen()
+        proxy.settimeout(timeout)
+
+        url: str = f"http://127.0.0.1:{proxy.getsockname()[1]}"
+        env: dict[str, str] = {
+            **os.environ,
+            "HTTP_PROXY": url,
+            "HTTPS_PROXY": url,
+            "NO_PROXY": "",
+            "GITHUB_USERNAMES": "octocat",
+            "HTTP_RETRIES": "0",
+            "STATE_PATH": str(Path(tmp) / "moniker.db"),
+            "LOG_LEVEL": "CRITICAL",
+        }
+
+        env.pop("GITHUB_TOKEN", None)
+
+        start: float = perf_counter()
+        proc: subprocess.Popen = subprocess.Popen(
+            [sys.executable, "moniker.py"],
+            cwd=ROOT,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        try:
+            conn, _ = proxy.accept()
+            elapsed: float = (perf_counter() - start) * 1000
+
+            conn.close()
+        finally:
+            proc.kill()
+            proc.wait()
+
+    return elapsed
+
+
+def main() -> int:
+    parser: ArgumentParser = ArgumentParser(description=__doc__.splitlines()[1])
+
+    parser.add_argument("--runs", type=int, default=5, help="number of cold starts")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=500.0,
+        help="maximum median milliseconds from process start to first request",
+    )
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+
+    args: Namespace = parser.parse_args()
+
+    imports: list[float] = []
+    firsts: list[float] = []
+    modules: list[tuple[float, str]] = []
+
+    for _ in range(args.runs):
+        total, modules = ImportTime(args.top)
+
+        imports.append(total)
+        firsts.append(FirstRequest())
+
+    print(f"import moniker (median of {args.runs}): {median(imports):.1f} ms")
+    print(f"start to first request (median of {args.runs}): {median(firsts):.1f} ms")
+    print(f"slowest top-level imports (last run):")
+
+    for cumulative, name in modules:
+        print(f"  {cumulative:8.1f} ms  {name}")
+
+    if median(firsts) > args.budget:
+        print(f"FAIL: exceeded startup budget of {args.budget:.0f} ms")
+
+        return 1
+
+    print(f"OK: within startup budget of {args.budget:.0f} ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
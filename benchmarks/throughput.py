@@ -0,0 +1,335 @@
+"""
+Measure Moniker's throughput offline, against a mock upstream which stands
+in for every service: checks per second, p50/p99 check latency, and peak
+memory as the number of usernames grows.
+
+Each service is benchmarked directly (its pooled client, rate limiting
+transport, and response handling), as is the complete Moniker.Start flow
+with every service configured (prefiltering, state, and concurrency
+limits included). The mock upstream replaces only the network transport,
+so no request leaves the machine. It serves realistic 200/404 statuses,
+HEAD responses, GitHub GraphQL results, and X __NEXT_DATA__ payloads, with
+configurable latency and a configurable share of HTTP 429 responses.
+
+Every measurement runs in a fresh process so that peak memory is not
+inherited from a previous, larger run.
+
+Usage: python benchmarks/throughput.py [--sizes 10,100,1000,10000,100000]
+    [--targets CASHAPP,...,MONIKER] [--latency 0] [--throttle 0]
+    [--rate 0] [--output results.json]
+"""
+
+import asyncio
+import json
+import os
+import random
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+from argparse import SUPPRESS, ArgumentParser, Namespace
+from asyncio import Semaphore
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(ROOT))
+
+# Benchmarked usernames are valid for every service, one in ten of them
+# is reported as available by the mock upstream.
+USERNAME: re.Pattern = re.compile(r"user\d{6}")
+ALIAS: re.Pattern = re.compile(r'(u\d+): repositoryOwner\(login: "([^"]+)"\)')
+
+# Markup which precedes the __NEXT_DATA__ script of an X timeline, so that
+# extraction has a realistic amount of the page to scan.
+PAGE: str = "<!DOCTYPE html><html><head>" + ('<link rel="preload" href="/x.js">' * 64)
+
+
+def Usernames(count: int) -> list[str]:
+    """Generate the provided number of distinct usernames."""
+
+    return [f"user{i:06d}" for i in range(count)]
+
+
+def IsAvailable(username: str) -> bool:
+    """Determine whether the mock upstream reports a username as available."""
+
+    return username.endswith("0")
+
+
+def Upstream(latency: float, throttle: float) -> Any:
+    """
+    Build a transport factory which serves mock responses in place of
+    httpx.AsyncHTTPTransport, accepting (and ignoring) the same arguments.
+    """
+
+    import httpx
+
+    async def Handle(request: httpx.Request) -> httpx.Response:
+        if latency:
+            await asyncio.sleep(latency)
+
+        if throttle and random.random() < throttle:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+
+        if request.url.path == "/graphql":
+            query: str = json.loads(request.content)["query"]
+            data: dict[str, Any] = {}
+            errors: list[dict[str, Any]] = []
+
+            for alias, username in ALIAS.findall(query):
+                if IsAvailable(username):
+                    data[alias] = None
+                    errors.append({"type": "NOT_FOUND", "path": [alias]})
+                else:
+                    data[alias] = {"login": username}
+
+            return httpx.Response(200, json={"data": data, "errors": errors})
+
+        username: str = USERNAME.search(str(request.url)).group(0)
+
+        if request.url.host == "syndication.twitter.com":
+            results: str = "false" if IsAvailable(username) else "true"
+            data: str = json.dumps(
+                {"props": {"pageProps": {"contextProvider": {"hasResults": None}}}}
+            ).replace("null", results)
+
+            return httpx.Response(
+                200,
+                html=f'{PAGE}</head><body><script id="__NEXT_DATA__" type="application/json">{data}</script></body></html>',
+            )
+
+        status: int = 404 if IsAvailable(username) else 200
+
+        if request.method == "HEAD":
+            return httpx.Response(status)
+
+        return httpx.Response(
+            status, html=f"{PAGE}</head><body>{username}</body></html>"
+        )
+
+    return lambda **kwargs: httpx.MockTransport(Handle)
+
+
+def Percentile(values: list[float], q: float) -> float:
+    """Return the q-th percentile (0-100) of the provided values."""
+
+    if not values:
+        return 0.0
+
+    ordered: list[float] = sorted(values)
+
+    return ordered[min(int(len(ordered) * q / 100), len(ordered) - 1)]
+
+
+async def BenchService(prefix: str, usernames: list[str]) -> list[float]:
+    """Check every username using a single service, returning each latency."""
+
+    from handlers import BuildClient, Prefilter, Setting
+    from services import Load, Service
+
+    integration: type[Service] = Load(prefix)
+    service: Service = integration(BuildClient(prefix, integration.http2))
+    limit: Semaphore = Semaphore(Setting("CONCURRENCY_LIMIT", 8, prefix))
+    latencies: list[float] = []
+
+    usernames, _ = Prefilter(integration, usernames)
+    usernames = integration.Expand(usernames)
+
+    async def Check(chunk: list[str]) -> None:
+        async with limit:
+            start: float = perf_counter()
+
+            if service.batch:
+                await service.AreUsersAvailable(chunk)
+            else:
+                await service.IsUserAvailable(chunk[0])
+
+            latencies.extend([perf_counter() - start] * len(chunk))
+
+    size: int = service.batch or 1
+
+    try:
+        await asyncio.gather(
+            *(Check(usernames[i : i + size]) for i in range(0, len(usernames), size))
+        )
+    finally:
+        await service.Close()
+
+    return latencies
+
+
+def BenchMoniker(usernames: list[str], state: str) -> list[float]:
+    """
+    Run the complete Moniker.Start flow with every service configured,
+    returning the latency of each check as recorded in its state.
+    """
+
+    import sqlite3
+
+    from moniker import Moniker
+    from services import Registry
+
+    for prefix in Registry:
+        os.environ[f"{prefix}_USERNAMES"] = ",".join(usernames)
+
+    sys.argv = [sys.argv[0]]
+
+    Moniker.Start(Moniker)
+
+    with sqlite3.connect(state) as db:
+        return [row[0] for row in db.execute("SELECT latency FROM latency")]
+
+
+def Worker(target: str, count: int) -> dict[str, Any]:
+    """Run a single measurement in the current process."""
+
+    from loguru import logger
+
+    import handlers.client
+
+    handlers.client.AsyncHTTPTransport = Upstream(
+        float(os.environ["BENCHMARK_LATENCY"]), float(os.environ["BENCHMARK_THROTTLE"])
+    )
+
+    logger.remove()
+    logger.add(sys.stderr, level=os.environ["LOG_LEVEL"])
+
+    usernames: list[str] = Usernames(count)
+    start: float = perf_counter()
+
+    if target == "MONIKER":
+        latencies: list[float] = BenchMoniker(usernames, os.environ["STATE_PATH"])
+    else:
+        latencies = asyncio.run(
+            BenchService(target.removesuffix("_GRAPHQL"), usernames)
+        )
+
+    elapsed: float = perf_counter() - start
+
+    return {
+        "target": target,
+        "usernames": count,
+        "checks": len(latencies),
+        "seconds": elapsed,
+        "checks_per_second": len(latencies) / elapsed,
+        "p50_ms": Percentile(latencies, 50) * 1000,
+        "p99_ms": Percentile(latencies, 99) * 1000,
+        # ru_maxrss is reported in kilobytes on Linux.
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def Measure(target: str, count: int, args: Namespace) -> dict[str, Any]:
+    """Run a single measurement in a fresh process."""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env: dict[str, str] = {
+            key: value
+            for key, value in os.environ.items()
+            if not key.endswith("_USERNAMES")
+            and key.upper() not in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY")
+        }
+
+        env.update(
+            {
+                "BENCHMARK_LATENCY": str(args.latency / 1000),
+                "BENCHMARK_THROTTLE": str(args.throttle),
+                "RATE_LIMIT": str(args.rate),
+                "HTTP_BACKOFF": "0",
+                "LOG_LEVEL": args.log_level,
+                "STATE_PATH": str(Path(tmp) / "moniker.db"),
+                "DISCORD_WEBHOOK_URL": "",
+                "LOG_DISCORD_WEBHOOK_URL": "",
+            }
+        )
+
+        env.pop("GITHUB_TOKEN", None)
+
+        if target.endswith("_GRAPHQL"):
+            env["GITHUB_TOKEN"] = "benchmark"
+
+        proc: subprocess.CompletedProcess = subprocess.run(
+            [sys.executable, __file__, "--worker", target, str(count)],
+            cwd=tmp,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+
+    if proc.returncode:
+        raise RuntimeError(f"{target} x {count:,} failed:\n{proc.stderr}")
+
+    return json.loads(proc.stdout.splitlines()[-1])
+
+
+def main() -> int:
+    from services import Registry
+
+    parser: ArgumentParser = ArgumentParser(description=__doc__.splitlines()[1])
+
+    parser.add_argument(
+        "--sizes",
+        default="10,100,1000,10000,100000",
+        help="comma-separated numbers of usernames",
+    )
+    parser.add_argument(
+        "--targets",
+        default=",".join([*Registry, "GITHUB_GRAPHQL", "MONIKER"]),
+        help="comma-separated service prefixes, GITHUB_GRAPHQL, and/or MONIKER",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="upstream latency (ms)"
+    )
+    parser.add_argument(
+        "--throttle",
+        type=float,
+        default=0.0,
+        help="share of upstream responses which are HTTP 429",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=0.0,
+        help="RATE_LIMIT per host, zero to disable throttling",
+    )
+    parser.add_argument("--log-level", default="WARNING", help="LOG_LEVEL of runs")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--worker", nargs=2, help=SUPPRESS)
+
+    args: Namespace = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(Worker(args.worker[0], int(args.worker[1]))))
+
+        return 0
+
+    results: list[dict[str, Any]] = []
+
+    print(
+        f"{'target':<16}{'usernames':>10}{'checks':>10}{'checks/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'peak MB':>10}"
+    )
+
+    for target in args.targets.split(","):
+        for count in map(int, args.sizes.split(",")):
+            result: dict[str, Any] = Measure(target, count, args)
+
+            results.append(result)
+
+            print(
+                f"{target:<16}{count:>10,}{result['checks']:>10,}{result['checks_per_second']:>12,.0f}"
+                f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}{result['peak_rss_mb']:>10.1f}",
+                flush=True,
+            )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=4))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
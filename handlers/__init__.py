@@ -1,2 +1,66 @@
-# ruff: noqa: F401
-from .intercept import Intercept
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# Handlers are imported on first access rather than with the package, so
+# that heavy dependencies (such as httpx and discord_webhook) are only
+# loaded when a run requires them.
+exports: dict[str, str] = {
+    "Breaker": ".breaker",
+    "Circuit": ".circuit",
+    "GetBreaker": ".breaker",
+    "BuildClient": ".client",
+    "Cache": ".cache",
+    "Setting": ".config",
+    "Hedge": ".hedge",
+    "Instrument": ".instrument",
+    "Intercept": ".intercept",
+    "Outbox": ".outbox",
+    "Planner": ".planner",
+    "IsValid": ".prefilter",
+    "Normalize": ".prefilter",
+    "Prefilter": ".prefilter",
+    "Probe": ".probe",
+    "Memo": ".query",
+    "QueryServer": ".query",
+    "RateLimit": ".ratelimit",
+    "Results": ".results",
+    "TokenBucket": ".ratelimit",
+    "ParseShard": ".shard",
+    "Shard": ".shard",
+    "Job": ".scheduler",
+    "Scheduler": ".scheduler",
+    "State": ".state",
+}
+
+if TYPE_CHECKING:
+    from .breaker import Breaker, GetBreaker
+    from .cache import Cache
+    from .circuit import Circuit
+    from .client import BuildClient
+    from .config import Setting
+    from .hedge import Hedge
+    from .instrument import Instrument
+    from .intercept import Intercept
+    from .outbox import Outbox
+    from .planner import Planner
+    from .prefilter import IsValid, Normalize, Prefilter
+    from .probe import Probe
+    from .query import Memo, QueryServer
+    from .ratelimit import RateLimit, TokenBucket
+    from .results import Results
+    from .scheduler import Job, Scheduler
+    from .shard import ParseShard, Shard
+    from .state import State
+
+
+def __getattr__(name: str) -> Any:
+    """Import a handler from its module on first access."""
+
+    if not (module := exports.get(name)):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value: Any = getattr(import_module(module, __name__), name)
+
+    globals()[name] = value
+
+    return value
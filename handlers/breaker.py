@@ -0,0 +1,140 @@
+from collections import deque
+from time import monotonic
+from typing import Self
+
+from loguru import logger
+
+from . import metrics
+from .config import Setting
+
+
+class Breaker:
+    """
+    Circuit breaker which stops checks against a service once it appears to
+    be down or blocking requests. The circuit opens when the share of failed
+    requests (errors, HTTP 5xx, and HTTP 429 which persisted after retrying)
+    in a rolling window, or the number of consecutive timeouts, reaches its
+    threshold. Once the cooldown has elapsed a single check is allowed
+    through as a probe, which closes the circuit if its request succeeds.
+    """
+
+    def __init__(
+        self: Self,
+        service: str,
+        rate: float,
+        window: int,
+        minimum: int,
+        timeouts: int,
+        cooldown: float,
+    ) -> None:
+        """Initialize a closed circuit."""
+
+        self.service: str = service
+        self.rate: float = rate
+        self.minimum: int = minimum
+        self.timeouts: int = timeouts
+        self.cooldown: float = cooldown
+        self.outcomes: deque[bool] = deque(maxlen=max(window, 1))
+        self.consecutive: int = 0
+        self.opened: float | None = None
+        self.probing: bool = False
+
+    def Allow(self: Self) -> bool:
+        """
+        Determine if a check may proceed. While the circuit is open, only a
+        single probe is allowed once the cooldown has elapsed.
+        """
+
+        if self.opened is None:
+            return True
+
+        if self.probing or monotonic() - self.opened < self.cooldown:
+            return False
+
+        self.probing = True
+
+        logger.info(f"Probing {self.service} after {self.cooldown:,.0f}s cooldown")
+
+        return True
+
+    def Record(self: Self, success: bool, timeout: bool = False) -> None:
+        """Record the outcome of a request to the service."""
+
+        if self.probing:
+            self.probing = False
+
+            if success:
+                self.Close()
+            else:
+                self.Open("probe failed")
+
+            return
+
+        # Requests which were already in progress when the circuit opened.
+        if self.opened is not None:
+            return
+
+        self.outcomes.append(success)
+        self.consecutive = self.consecutive + 1 if timeout else 0
+
+        failures: int = self.outcomes.count(False)
+
+        if 0 < self.timeouts <= self.consecutive:
+            self.Open(f"{self.consecutive} consecutive requests timed out")
+        elif (
+            self.rate > 0
+            and len(self.outcomes) >= self.minimum
+            and failures / len(self.outcomes) >= self.rate
+        ):
+            self.Open(f"{failures} of the last {len(self.outcomes)} requests failed")
+
+    def Release(self: Self) -> None:
+        """
+        Allow another probe if the check allowed through as a probe completed
+        without making a request (e.g. it was served from the cache).
+        """
+
+        self.probing = False
+
+    def Open(self: Self, reason: str) -> None:
+        """Open the circuit, skipping checks until the cooldown has elapsed."""
+
+        self.opened = monotonic()
+
+        metrics.circuit.Set(1, service=self.service)
+
+        logger.warning(
+            f"Opened circuit for {self.service} ({reason}), skipping checks for {self.cooldown:,.0f}s"
+        )
+
+    def Close(self: Self) -> None:
+        """Close the circuit, resuming checks."""
+
+        self.opened = None
+        self.consecutive = 0
+        self.outcomes.clear()
+
+        metrics.circuit.Set(0, service=self.service)
+
+        logger.success(f"Closed circuit for {self.service}, resuming checks")
+
+
+# Circuit breakers are keyed by service prefix and shared by every client
+# of that service.
+breakers: dict[str, Breaker] = {}
+
+
+def GetBreaker(prefix: str) -> Breaker:
+    """Fetch the circuit breaker of a service, creating it if necessary."""
+
+    if not (breaker := breakers.get(prefix)):
+        breaker = breakers[prefix] = Breaker(
+            prefix,
+            rate=Setting("BREAKER_ERROR_RATE", 0.5, prefix),
+            window=Setting("BREAKER_WINDOW", 20, prefix),
+            minimum=Setting("BREAKER_MIN_REQUESTS", 10, prefix),
+            timeouts=Setting("BREAKER_TIMEOUTS", 5, prefix),
+            cooldown=Setting("BREAKER_COOLDOWN", 60.0, prefix),
+        )
+
+    return breaker
@@ -0,0 +1,147 @@
+import json
+import sqlite3
+from sqlite3 import Connection
+from time import time
+from typing import Self
+
+from httpx import AsyncBaseTransport, Headers, Request, Response
+from loguru import logger
+
+from . import metrics
+
+# HTTP status codes which may be stored and replayed (RFC 9110, 15.1).
+CACHEABLE: tuple[int, ...] = (200, 203, 204, 300, 301, 404, 405, 410, 414, 501)
+
+
+class Cache(AsyncBaseTransport):
+    """
+    Transport which persists responses to GET and HEAD requests, replays
+    them without a request while they are fresh, and afterwards revalidates
+    them using their ETag and Last-Modified validators so that an unchanged
+    response costs a 304 (Not Modified) rather than the entire payload.
+    """
+
+    def __init__(
+        self: Self, transport: AsyncBaseTransport, path: str, ttl: float, service: str
+    ) -> None:
+        """Wrap the provided transport with a cache persisted to path."""
+
+        self.transport: AsyncBaseTransport = transport
+        self.ttl: float = ttl
+        self.service: str = service
+        self.db: Connection = sqlite3.connect(path, isolation_level=None)
+
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache (
+                method TEXT NOT NULL,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                stored REAL NOT NULL,
+                PRIMARY KEY (method, url)
+            )
+            """
+        )
+
+    async def handle_async_request(self: Self, request: Request) -> Response:
+        """Serve a request from the cache where possible, otherwise send it."""
+
+        if request.method not in ("GET", "HEAD"):
+            return await self.transport.handle_async_request(request)
+
+        key: tuple[str, str] = (request.method, str(request.url))
+        row: tuple[int, str, bytes, float] | None = self.db.execute(
+            "SELECT status, headers, body, stored FROM cache WHERE method = ? AND url = ?",
+            key,
+        ).fetchone()
+
+        if row:
+            status, headers, body, stored = row
+            cached: Headers = Headers(json.loads(headers))
+
+            if time() - stored < self.ttl:
+                metrics.http_cache.Inc(service=self.service, result="hit")
+
+                logger.trace("Cache hit for {} {}", *key)
+
+                return Response(status, headers=cached, content=body, request=request)
+
+            if etag := cached.get("ETag"):
+                request.headers["If-None-Match"] = etag
+
+            if modified := cached.get("Last-Modified"):
+                request.headers["If-Modified-Since"] = modified
+
+        res: Response = await self.transport.handle_async_request(request)
+
+        if row and res.status_code == 304:
+            await res.aclose()
+
+            # Headers sent with a 304 (such as a new ETag) supersede those
+            # which were stored.
+            cached.update(
+                {
+                    name: value
+                    for name, value in res.headers.items()
+                    if name.lower() not in ("content-length", "content-encoding")
+                }
+            )
+
+            self.db.execute(
+                "UPDATE cache SET headers = ?, stored = ? WHERE method = ? AND url = ?",
+                (json.dumps(cached.multi_items()), time(), *key),
+            )
+
+            metrics.http_cache.Inc(service=self.service, result="revalidated")
+
+            logger.trace("Revalidated cached {} {}", *key)
+
+            return Response(status, headers=cached, content=body, request=request)
+
+        metrics.http_cache.Inc(service=self.service, result="miss")
+
+        # Responses are only worth storing if they may be replayed, either
+        # while fresh or after revalidation.
+        if not (
+            res.status_code in CACHEABLE
+            and (
+                self.ttl > 0 or "ETag" in res.headers or "Last-Modified" in res.headers
+            )
+            and "no-store" not in res.headers.get("Cache-Control", "")
+        ):
+            return res
+
+        # The body is stored as received (i.e. still compressed), so it must
+        # be read in full before it can be replayed.
+        body: bytes = b"".join([chunk async for chunk in res.stream])
+
+        await res.aclose()
+
+        self.db.execute(
+            "INSERT OR REPLACE INTO cache (method, url, status, headers, body, stored) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                *key,
+                res.status_code,
+                json.dumps(res.headers.multi_items()),
+                body,
+                time(),
+            ),
+        )
+
+        return Response(
+            res.status_code,
+            headers=res.headers,
+            content=body,
+            request=request,
+            extensions=res.extensions,
+        )
+
+    async def aclose(self: Self) -> None:
+        """Close the wrapped transport and the cache."""
+
+        await self.transport.aclose()
+
+        self.db.close()
@@ -0,0 +1,100 @@
+from collections.abc import Iterator
+from hashlib import blake2b
+from itertools import chain, product
+from os import environ, path
+
+
+def Charset(spec: str) -> str:
+    """Expand a character set which may contain ranges (e.g. a-z0-9_)."""
+
+    characters: list[str] = []
+    i: int = 0
+
+    while i < len(spec):
+        if i + 2 < len(spec) and spec[i + 1] == "-":
+            characters.extend(chr(c) for c in range(ord(spec[i]), ord(spec[i + 2]) + 1))
+            i += 3
+        else:
+            characters.append(spec[i])
+            i += 1
+
+    # Preserve the order of first appearance so that sweeps are repeatable.
+    return "".join(dict.fromkeys(characters))
+
+
+def Lengths(spec: str) -> range:
+    """Parse a length (e.g. 4) or inclusive range of lengths (e.g. 3-4)."""
+
+    low, _, high = spec.partition("-")
+
+    try:
+        return range(int(low), int(high or low) + 1)
+    except ValueError:
+        raise ValueError(f"Invalid length {spec!r}, expected N or N-M") from None
+
+
+def Words(file: str) -> Iterator[str]:
+    """Read a wordlist one line at a time, ignoring blank lines and # comments."""
+
+    with open(file, encoding="utf-8", errors="replace") as words:
+        for line in words:
+            if (word := line.strip()) and not word.startswith("#"):
+                yield word
+
+
+def IsConfigured(prefix: str) -> bool:
+    """Determine if a sweep is configured for a service."""
+
+    return bool(
+        environ.get(f"{prefix}_SWEEP_WORDLIST")
+        or environ.get(f"{prefix}_SWEEP_CHARSET")
+    )
+
+
+def Candidates(prefix: str) -> tuple[Iterator[str], str]:
+    """
+    Lazily generate the sweep candidates of a service, alongside a signature
+    of its configuration which identifies checkpoints of the sweep.
+
+    Candidates are every word of <PREFIX>_SWEEP_WORDLIST followed by every
+    combination of <PREFIX>_SWEEP_CHARSET of each <PREFIX>_SWEEP_LENGTH, each
+    formatted with every template of <PREFIX>_SWEEP_TEMPLATES (e.g. {}hq).
+    Nothing is held in memory, so sweeps of any size use constant memory.
+    """
+
+    wordlist: str = environ.get(f"{prefix}_SWEEP_WORDLIST", "")
+    charset: str = Charset(environ.get(f"{prefix}_SWEEP_CHARSET", ""))
+    lengths: range = Lengths(environ.get(f"{prefix}_SWEEP_LENGTH", "4"))
+    templates: list[str] = [
+        template.strip()
+        for template in environ.get(f"{prefix}_SWEEP_TEMPLATES", "{}").split(",")
+        if "{}" in template
+    ] or ["{}"]
+
+    sources: list[Iterator[str]] = []
+    signature: list[str] = [charset, str(lengths), ",".join(templates)]
+
+    if wordlist:
+        sources.append(Words(wordlist))
+
+        # An edited wordlist would resume from the wrong position.
+        signature += [
+            wordlist,
+            str(path.getsize(wordlist)),
+            str(path.getmtime(wordlist)),
+        ]
+
+    if charset:
+        sources.append(
+            "".join(characters)
+            for length in lengths
+            for characters in product(charset, repeat=length)
+        )
+
+    candidates: Iterator[str] = (
+        template.replace("{}", base)
+        for base in chain.from_iterable(sources)
+        for template in templates
+    )
+
+    return candidates, blake2b("\0".join(signature).encode(), digest_size=8).hexdigest()
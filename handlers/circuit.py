@@ -0,0 +1,38 @@
+from typing import Self
+
+from httpx import AsyncBaseTransport, Request, Response, TimeoutException
+
+from .breaker import Breaker, GetBreaker
+
+
+class Circuit(AsyncBaseTransport):
+    """Transport which reports the outcome of every request to the service's breaker."""
+
+    def __init__(self: Self, transport: AsyncBaseTransport, service: str) -> None:
+        """Wrap the provided transport, reporting to the service's breaker."""
+
+        self.transport: AsyncBaseTransport = transport
+        self.breaker: Breaker = GetBreaker(service)
+
+    async def handle_async_request(self: Self, request: Request) -> Response:
+        """Send a request, reporting whether it succeeded."""
+
+        try:
+            res: Response = await self.transport.handle_async_request(request)
+        except TimeoutException:
+            self.breaker.Record(False, timeout=True)
+
+            raise
+        except Exception:
+            self.breaker.Record(False)
+
+            raise
+
+        self.breaker.Record(res.status_code < 500 and res.status_code != 429)
+
+        return res
+
+    async def aclose(self: Self) -> None:
+        """Close the wrapped transport."""
+
+        await self.transport.aclose()
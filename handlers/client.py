@@ -0,0 +1,147 @@
+from functools import cache
+from os import environ
+from ssl import SSLContext
+from urllib.request import getproxies
+
+import httpx
+from httpx import AsyncBaseTransport, AsyncClient, AsyncHTTPTransport, Limits, Timeout
+from loguru import logger
+
+from .cache import Cache
+from .circuit import Circuit
+from .config import Setting
+from .hedge import Hedge
+from .instrument import Instrument
+from .ratelimit import RateLimit
+
+
+@cache
+def BuildContext(http2: bool) -> SSLContext:
+    """
+    Build the SSL context shared by every transport. Loading the trusted
+    certificates is one of the most expensive steps of starting a run, so
+    it is done once per process rather than once per transport.
+    """
+
+    context: SSLContext = httpx.create_ssl_context()
+
+    context.set_alpn_protocols(["http/1.1", "h2"] if http2 else ["http/1.1"])
+
+    return context
+
+
+def BuildClient(prefix: str, http2: bool = False, circuit: bool = True) -> AsyncClient:
+    """
+    Build a long-lived, pooled HTTP client for a service. The client is
+    intended to be created once per run and shared by every check for
+    that service so that connections are kept alive and reused.
+
+    Requests are reported to the service's circuit breaker unless circuit
+    is disabled, as it is for clients of a single host among several
+    (e.g. a Mastodon instance), whose failures say nothing of the others.
+    """
+
+    limits: Limits = Limits(
+        max_connections=Setting("HTTP_POOL_SIZE", 100, prefix),
+        max_keepalive_connections=Setting("HTTP_KEEPALIVE_CONNECTIONS", 20, prefix),
+        keepalive_expiry=Setting("HTTP_KEEPALIVE_EXPIRY", 30.0, prefix),
+    )
+    timeout: Timeout = Timeout(
+        Setting("HTTP_TIMEOUT", 10.0, prefix),
+        connect=Setting("HTTP_CONNECT_TIMEOUT", 5.0, prefix),
+        read=Setting(
+            "HTTP_READ_TIMEOUT", Setting("HTTP_TIMEOUT", 10.0, prefix), prefix
+        ),
+    )
+
+    # HTTP/2 is only negotiated for hosts known to support it, and only
+    # when the optional h2 dependency is installed.
+    if http2 and Setting("HTTP2", False, prefix):
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning(
+                f"HTTP/2 requested for {prefix} but the h2 package is not installed, falling back to HTTP/1.1"
+            )
+
+            http2 = False
+    else:
+        http2 = False
+
+    def Transport(proxy: str | None = None) -> AsyncBaseTransport:
+        """
+        Build a rate limited (and, if enabled, hedged and cached) transport,
+        optionally routed through a proxy.
+        """
+
+        transport: AsyncBaseTransport = Instrument(
+            AsyncHTTPTransport(
+                verify=BuildContext(http2),
+                limits=limits,
+                http2=http2,
+                proxy=proxy,
+            ),
+            prefix,
+        )
+
+        # Hedging is wrapped by rate limiting so that a hedge is sent as soon
+        # as it is due, and its response time excludes throttling. Hedges draw
+        # a token of their own without waiting (see Hedge).
+        if Setting("HEDGE", False, prefix):
+            transport = Hedge(
+                transport,
+                Setting("HEDGE_QUANTILE", 0.95, prefix),
+                Setting("HEDGE_BUDGET", 0.05, prefix),
+                prefix,
+            )
+
+        transport = RateLimit(
+            transport,
+            rate=Setting("RATE_LIMIT", 10.0, prefix),
+            burst=Setting("RATE_LIMIT_BURST", 10, prefix),
+            retries=Setting("HTTP_RETRIES", 3, prefix),
+            backoff=Setting("HTTP_BACKOFF", 1.0, prefix),
+            ceiling=Setting("HTTP_BACKOFF_MAX", 60.0, prefix),
+        )
+
+        # The breaker wraps rate limiting so that it observes the outcome of
+        # a request after its retries, rather than every throttled attempt.
+        if circuit:
+            transport = Circuit(transport, prefix)
+
+        # The cache wraps rate limiting so that fresh responses are served
+        # without consuming a token.
+        if Setting("HTTP_CACHE", False, prefix):
+            transport = Cache(
+                transport,
+                Setting(
+                    "HTTP_CACHE_PATH", environ.get("STATE_PATH", "moniker.db"), prefix
+                ),
+                Setting("HTTP_CACHE_TTL", 0.0, prefix),
+                prefix,
+            )
+
+        return transport
+
+    # httpx ignores proxy environment variables when a custom transport is
+    # provided, so honor them by mounting a proxied transport per scheme.
+    proxies: dict[str, str] = getproxies()
+    mounts: dict[str, AsyncBaseTransport] = {}
+    bypass: list[str] = [
+        host.strip() for host in proxies.get("no", "").split(",") if host.strip()
+    ]
+
+    if "*" not in bypass:
+        for scheme in ("http", "https"):
+            if proxy := proxies.get(scheme, proxies.get("all")):
+                mounts[f"{scheme}://"] = Transport(proxy)
+
+        if mounts:
+            for host in bypass:
+                mounts[
+                    f"all://*{host}" if host.startswith(".") else f"all://{host}"
+                ] = Transport()
+
+    logger.debug(f"Built HTTP client for {prefix} ({limits}, {timeout}, http2={http2})")
+
+    return AsyncClient(timeout=timeout, transport=Transport(), mounts=mounts)
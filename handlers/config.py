@@ -0,0 +1,28 @@
+from os import environ
+from typing import Any
+
+
+def Setting(key: str, default: Any, prefix: str | None = None) -> Any:
+    """
+    Resolve a configuration value from the environment, preferring a
+    service-specific override (e.g. GITHUB_HTTP_TIMEOUT) to the global
+    value (e.g. HTTP_TIMEOUT), and casting it to the type of the default.
+    """
+
+    value: str | None = None
+
+    if prefix:
+        value = environ.get(f"{prefix}_{key}")
+
+    if value is None:
+        value = environ.get(key)
+
+    if value is None or value == "":
+        return default
+
+    if isinstance(default, bool):
+        return value.lower() in ("1", "true", "yes", "on")
+    elif default is None:
+        return value
+
+    return type(default)(value)
@@ -0,0 +1,194 @@
+import asyncio
+from asyncio import Task
+from collections import deque
+from time import perf_counter
+from typing import Self
+
+from httpx import AsyncBaseTransport, Request, Response
+from loguru import logger
+
+from . import metrics
+from .ratelimit import TokenBucket, buckets
+
+# Number of recent response times per host from which the hedging delay is
+# derived, and the number required before any request is hedged.
+WINDOW: int = 100
+MINIMUM: int = 20
+
+
+class Tail:
+    """Recent response times of a host, and the share of its requests which were hedged."""
+
+    def __init__(self: Self) -> None:
+        """Initialize an empty history."""
+
+        self.durations: deque[float] = deque(maxlen=WINDOW)
+        self.requests: int = 0
+        self.hedges: int = 0
+
+    def Observe(self: Self, duration: float) -> None:
+        """Record the response time of a request."""
+
+        self.durations.append(duration)
+
+    def Delay(self: Self, quantile: float) -> float | None:
+        """
+        Determine the response time at the provided quantile (e.g. 0.95),
+        after which a request is hedged, if enough have been observed.
+        """
+
+        if len(self.durations) < MINIMUM:
+            return None
+
+        ordered: list[float] = sorted(self.durations)
+
+        return ordered[min(int(len(ordered) * quantile), len(ordered) - 1)]
+
+    def Allow(self: Self, budget: float) -> bool:
+        """Determine if another hedge would keep hedges within budget of all requests."""
+
+        return self.hedges + 1 <= self.requests * budget
+
+
+# Response times are keyed by host and shared by every client of that host.
+tails: dict[str, Tail] = {}
+
+
+class Hedge(AsyncBaseTransport):
+    """
+    Transport which trims tail latency by sending a second, identical GET
+    or HEAD request should the first not have responded within the host's
+    recent response time at the configured quantile. Whichever responds
+    first is used and the other is cancelled. Hedges are limited to a share
+    (budget) of all requests so that they never add more than that load,
+    and each consumes a token from the host's rate limit (see RateLimit),
+    so that no hedge is sent while the host is throttling requests.
+    """
+
+    def __init__(
+        self: Self,
+        transport: AsyncBaseTransport,
+        quantile: float,
+        budget: float,
+        service: str,
+    ) -> None:
+        """Wrap the provided transport, hedging within the provided budget."""
+
+        self.transport: AsyncBaseTransport = transport
+        self.quantile: float = quantile
+        self.budget: float = budget
+        self.service: str = service
+
+    async def handle_async_request(self: Self, request: Request) -> Response:
+        """Send a request, hedging it should it respond slowly."""
+
+        if request.method not in ("GET", "HEAD"):
+            return await self.transport.handle_async_request(request)
+
+        if not (tail := tails.get(request.url.host)):
+            tail = tails[request.url.host] = Tail()
+
+        tail.requests += 1
+
+        if (delay := tail.Delay(self.quantile)) is None or not tail.Allow(self.budget):
+            return await self.Send(tail, request)
+
+        # The hedge is a copy so that the two requests do not share state
+        # which is attached to a request as it is sent.
+        copy: Request = Request(
+            request.method,
+            request.url,
+            headers=request.headers,
+            extensions={
+                key: value
+                for key, value in request.extensions.items()
+                if key != "trace"
+            },
+        )
+        tasks: set[Task] = {asyncio.create_task(self.Send(tail, request))}
+
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+
+            if done:
+                return done.pop().result()
+
+            # The budget may have been spent by other requests meanwhile.
+            if not tail.Allow(self.budget):
+                return await next(iter(tasks))
+
+            # Hedges are sent from within rate limiting, so they take a token
+            # themselves, and are abandoned rather than delayed should none be
+            # available or the host have asked for requests to pause.
+            bucket: TokenBucket | None = buckets.get(request.url.host)
+
+            if bucket and not bucket.TryAcquire():
+                metrics.http_hedges.Inc(service=self.service, result="throttled")
+
+                return await next(iter(tasks))
+
+            tail.hedges += 1
+            hedge: Task = asyncio.create_task(self.Send(tail, copy))
+            tasks.add(hedge)
+
+            metrics.http_hedges.Inc(service=self.service, result="sent")
+
+            logger.trace(
+                "Hedged {} {} after {:.3f}s", request.method, request.url, delay
+            )
+
+            return await self.Race(tasks, hedge)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def Race(self: Self, tasks: set[Task], hedge: Task) -> Response:
+        """
+        Await the first request to respond, falling back to the other should
+        one fail. If both fail, the error of the original request is raised.
+        """
+
+        pending: set[Task] = set(tasks)
+        error: BaseException | None = None
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            for task in done:
+                if (e := task.exception()) is not None:
+                    if task is not hedge or error is None:
+                        error = e
+
+                    continue
+
+                res: Response = task.result()
+
+                # Both may have responded at once, in which case the other
+                # response is discarded.
+                for other in done - {task}:
+                    if other.exception() is None:
+                        await other.result().aclose()
+
+                if task is hedge:
+                    metrics.http_hedges.Inc(service=self.service, result="won")
+
+                return res
+
+        raise error
+
+    async def Send(self: Self, tail: Tail, request: Request) -> Response:
+        """Send a request, recording its response time."""
+
+        start: float = perf_counter()
+        res: Response = await self.transport.handle_async_request(request)
+
+        tail.Observe(perf_counter() - start)
+
+        return res
+
+    async def aclose(self: Self) -> None:
+        """Close the wrapped transport."""
+
+        await self.transport.aclose()
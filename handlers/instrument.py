@@ -0,0 +1,56 @@
+from time import perf_counter
+from typing import Self
+
+from httpx import AsyncBaseTransport, Request, Response, TimeoutException
+
+from . import metrics, profiler
+
+
+class Instrument(AsyncBaseTransport):
+    """
+    Transport which records the duration and outcome of every request
+    attempt, including those which are later retried, in the metrics. When
+    profiling, the duration of each phase of a request is also recorded.
+    """
+
+    def __init__(self: Self, transport: AsyncBaseTransport, service: str) -> None:
+        """Wrap the provided transport, labelling its metrics by service."""
+
+        self.transport: AsyncBaseTransport = transport
+        self.service: str = service
+
+    async def handle_async_request(self: Self, request: Request) -> Response:
+        """Send a request, recording its duration and status or error."""
+
+        if profiler.timings is not None:
+            request.extensions.setdefault("trace", profiler.Trace(self.service))
+
+        start: float = perf_counter()
+
+        try:
+            res: Response = await self.transport.handle_async_request(request)
+        except Exception as e:
+            metrics.http_errors.Inc(
+                service=self.service,
+                error="timeout"
+                if isinstance(e, TimeoutException)
+                else type(e).__name__,
+            )
+
+            raise
+        finally:
+            duration: float = perf_counter() - start
+
+            metrics.http_duration.Observe(
+                duration, service=self.service, method=request.method
+            )
+            profiler.Record(self.service, "request", duration)
+
+        metrics.http_responses.Inc(service=self.service, status=str(res.status_code))
+
+        return res
+
+    async def aclose(self: Self) -> None:
+        """Close the wrapped transport."""
+
+        await self.transport.aclose()
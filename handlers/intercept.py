@@ -1,4 +1,6 @@
 import logging
+import sys
+from functools import cache
 from logging import Handler, LogRecord
 from types import FrameType
 from typing import Self
@@ -6,25 +8,39 @@ from typing import Self
 from loguru import logger
 
 
+@cache
+def GetLevel(name: str, number: int) -> str | int:
+    """Resolve the Loguru level of a logging level, falling back to its number."""
+
+    try:
+        return logger.level(name).name
+    except ValueError:
+        return number
+
+
 class Intercept(Handler):
     """Handler to intercept logging messages and redirect to Loguru."""
 
+    # Number of frames between emit and the caller of the logging function,
+    # keyed by call site. The depth of a call site never changes, so the
+    # stack is only walked the first time a call site is seen.
+    depths: dict[tuple[str, int], int] = {}
+
     def emit(self: Self, record: LogRecord):
         """Log emitter."""
 
-        level: str = record.levelno
-        frame: FrameType = logging.currentframe()
-        depth: int = 2
+        key: tuple[str, int] = (record.pathname, record.lineno)
+
+        if (depth := self.depths.get(key)) is None:
+            frame: FrameType = sys._getframe(1)
+            depth = 1
 
-        try:
-            level = logger.level(record.levelname).name
-        except Exception as e:
-            logger.opt(exception=e).trace(f"Failed to determine logger intercept level")
+            while frame.f_code.co_filename == logging.__file__:
+                frame = frame.f_back
+                depth += 1
 
-        while frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back
-            depth += 1
+            self.depths[key] = depth
 
         logger.opt(depth=depth, exception=record.exc_info).log(
-            level, record.getMessage()
+            GetLevel(record.levelname, record.levelno), record.getMessage()
         )
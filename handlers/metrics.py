@@ -0,0 +1,283 @@
+import asyncio
+import os
+import tempfile
+from asyncio import Server, StreamReader, StreamWriter
+from math import inf
+from typing import Self
+
+from loguru import logger
+
+# Upper bounds (seconds) of the latency histogram buckets.
+BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+def FormatLabels(labels: dict[str, str]) -> str:
+    """Format labels using the Prometheus text exposition format."""
+
+    if not labels:
+        return ""
+
+    pairs: list[str] = []
+
+    for key, value in labels.items():
+        value = value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+        pairs.append(f'{key}="{value}"')
+
+    return "{" + ",".join(pairs) + "}"
+
+
+def FormatValue(value: float) -> str:
+    """Format a sample value using the Prometheus text exposition format."""
+
+    if value == inf:
+        return "+Inf"
+
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    """A named metric with a value per distinct set of labels."""
+
+    kind: str = "untyped"
+
+    def __init__(self: Self, name: str, description: str) -> None:
+        """Register the metric so that it is included in the exposition."""
+
+        self.name: str = name
+        self.description: str = description
+        self.values: dict[tuple[tuple[str, str], ...], float] = {}
+
+        metrics.append(self)
+
+    def Samples(self: Self) -> list[str]:
+        """Render a sample line per distinct set of labels."""
+
+        return [
+            f"{self.name}{FormatLabels(dict(key))} {FormatValue(value)}"
+            for key, value in self.values.items()
+        ]
+
+    def Render(self: Self) -> str:
+        """Render the metric using the Prometheus text exposition format."""
+
+        return "\n".join(
+            [
+                f"# HELP {self.name} {self.description}",
+                f"# TYPE {self.name} {self.kind}",
+                *self.Samples(),
+            ]
+        )
+
+
+class Counter(Metric):
+    """A cumulative value which only increases."""
+
+    kind: str = "counter"
+
+    def Inc(self: Self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the value of the provided labels."""
+
+        key: tuple[tuple[str, str], ...] = tuple(labels.items())
+
+        self.values[key] = self.values.get(key, 0.0) + amount
+
+
+class Gauge(Metric):
+    """A value which may be set arbitrarily."""
+
+    kind: str = "gauge"
+
+    def Set(self: Self, value: float, **labels: str) -> None:
+        """Set the value of the provided labels."""
+
+        self.values[tuple(labels.items())] = value
+
+
+class Histogram(Metric):
+    """A distribution of observed values, counted into cumulative buckets."""
+
+    kind: str = "histogram"
+
+    def __init__(
+        self: Self, name: str, description: str, buckets: tuple[float, ...] = BUCKETS
+    ) -> None:
+        """Register the histogram with the provided bucket upper bounds."""
+
+        super().__init__(name, description)
+
+        self.buckets: tuple[float, ...] = (*buckets, inf)
+        self.counts: dict[tuple[tuple[str, str], ...], list[int]] = {}
+
+    def Observe(self: Self, value: float, **labels: str) -> None:
+        """Record an observation for the provided labels."""
+
+        key: tuple[tuple[str, str], ...] = tuple(labels.items())
+
+        if not (counts := self.counts.get(key)):
+            counts = self.counts[key] = [0] * len(self.buckets)
+
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+
+        self.values[key] = self.values.get(key, 0.0) + value
+
+    def Samples(self: Self) -> list[str]:
+        """Render the bucket, sum, and count samples of each set of labels."""
+
+        samples: list[str] = []
+
+        for key, counts in self.counts.items():
+            labels: dict[str, str] = dict(key)
+
+            for bound, count in zip(self.buckets, counts):
+                samples.append(
+                    f"{self.name}_bucket{FormatLabels({**labels, 'le': FormatValue(bound)})} {count}"
+                )
+
+            samples.append(
+                f"{self.name}_sum{FormatLabels(labels)} {FormatValue(self.values[key])}"
+            )
+            samples.append(f"{self.name}_count{FormatLabels(labels)} {counts[-1]}")
+
+        return samples
+
+
+# Every metric registers itself here upon creation, in exposition order.
+metrics: list[Metric] = []
+
+http_duration: Histogram = Histogram(
+    "moniker_http_request_duration_seconds",
+    "Duration of HTTP requests to services until the response headers are received.",
+)
+http_responses: Counter = Counter(
+    "moniker_http_responses_total",
+    "HTTP responses received from services by status code.",
+)
+http_errors: Counter = Counter(
+    "moniker_http_errors_total",
+    "HTTP requests to services which failed without a response, by error.",
+)
+http_cache: Counter = Counter(
+    "moniker_http_cache_total",
+    "Cacheable HTTP requests to services, by whether they were served from the cache.",
+)
+http_hedges: Counter = Counter(
+    "moniker_http_hedges_total",
+    "Hedged HTTP requests to services, by whether the hedge was sent, responded first, or was throttled.",
+)
+circuit: Gauge = Gauge(
+    "moniker_circuit_open",
+    "Whether the circuit breaker of a service is open (1) or closed (0).",
+)
+checks: Counter = Counter(
+    "moniker_checks_total",
+    "Username availability checks completed, by result.",
+)
+check_duration: Histogram = Histogram(
+    "moniker_check_duration_seconds",
+    "Duration of username availability checks, including retries.",
+)
+notifications: Counter = Counter(
+    "moniker_notifications_total",
+    "Discord notifications processed by the outbox, by result.",
+)
+notification_duration: Histogram = Histogram(
+    "moniker_notification_delivery_duration_seconds",
+    "Duration of Discord webhook deliveries.",
+)
+run_duration: Gauge = Gauge(
+    "moniker_run_duration_seconds",
+    "Duration of the most recent run of all username availability checks.",
+)
+run_rate: Gauge = Gauge(
+    "moniker_run_checks_per_second",
+    "Username availability checks completed per second by the most recent run.",
+)
+run_completed: Gauge = Gauge(
+    "moniker_run_completed_timestamp_seconds",
+    "Unix time at which the most recent run completed.",
+)
+
+
+def Render() -> str:
+    """Render every metric using the Prometheus text exposition format."""
+
+    return "\n".join(metric.Render() for metric in metrics) + "\n"
+
+
+def WriteTextfile(path: str) -> None:
+    """
+    Write every metric to a file for the node_exporter textfile collector.
+    The file is replaced atomically so that a partial write is never read.
+    """
+
+    directory: str = os.path.dirname(os.path.abspath(path))
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    with os.fdopen(fd, "w") as file:
+        file.write(Render())
+
+    os.chmod(temporary, 0o644)
+    os.replace(temporary, path)
+
+    logger.debug(f"Wrote metrics to {path}")
+
+
+async def Respond(reader: StreamReader, writer: StreamWriter) -> None:
+    """Serve a single HTTP request for the metrics endpoint."""
+
+    try:
+        line: bytes = await reader.readline()
+
+        # Discard the request headers.
+        while await reader.readline() not in (b"\r\n", b"\n", b""):
+            pass
+
+        parts: list[str] = line.decode("latin-1").split()
+
+        if (
+            len(parts) >= 2
+            and parts[0] == "GET"
+            and parts[1].split("?")[0] == "/metrics"
+        ):
+            status: str = "200 OK"
+            body: bytes = Render().encode()
+        else:
+            status = "404 Not Found"
+            body = b"Not Found\n"
+
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: text/plain; version=0.0.4; charset=utf-8\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+            + body
+        )
+
+        await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def Serve(host: str, port: int) -> Server:
+    """Expose every metric at /metrics for as long as the returned server runs."""
+
+    server: Server = await asyncio.start_server(Respond, host, port)
+
+    logger.success(f"Serving metrics at http://{host}:{port}/metrics")
+
+    return server
@@ -0,0 +1,179 @@
+import asyncio
+import json
+import sqlite3
+from asyncio import Event, Task
+from sqlite3 import Connection
+from time import perf_counter, time
+from typing import TYPE_CHECKING, Any, Self
+
+from loguru import logger
+
+from . import metrics
+
+if TYPE_CHECKING:
+    from discord_webhook import DiscordEmbed
+
+# Maximum number of embeds Discord permits in a single webhook message.
+EMBED_LIMIT: int = 10
+
+# Seconds for which queued embeds claimed for delivery are withheld from
+# other workers sharing the outbox, after which they are assumed lost (e.g.
+# the worker exited) and may be claimed again.
+LEASE: float = 300.0
+
+
+class Outbox:
+    """
+    Durable, in-process queue of Discord embeds which are delivered in
+    batches by a background worker, independent of username checks.
+    """
+
+    def __init__(self: Self, path: str, backoff: float = 5.0) -> None:
+        """Open (and create, if necessary) the persisted outbox."""
+
+        self.backoff: float = backoff
+        self.db: Connection = sqlite3.connect(
+            path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self.pending: Event = Event()
+        self.closing: bool = False
+        self.worker: Task | None = None
+
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL,
+                embed TEXT NOT NULL,
+                claimed REAL
+            )
+            """
+        )
+
+        # Outboxes created before workers could share them lack claims.
+        if "claimed" not in [
+            row[1] for row in self.db.execute("PRAGMA table_info(outbox)")
+        ]:
+            self.db.execute("ALTER TABLE outbox ADD COLUMN claimed REAL")
+
+        if count := self.db.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]:
+            logger.info(f"Recovered {count:,} undelivered notifications from outbox")
+
+            self.pending.set()
+
+    def Start(self: Self) -> None:
+        """Begin draining the outbox in the background."""
+
+        self.worker = asyncio.create_task(self.Drain())
+
+    def Put(self: Self, url: str, embed: "DiscordEmbed") -> None:
+        """Persist an embed for delivery to the provided webhook URL."""
+
+        self.db.execute(
+            "INSERT INTO outbox (url, embed) VALUES (?, ?)",
+            (url, json.dumps(embed.__dict__)),
+        )
+
+        self.pending.set()
+
+    async def Drain(self: Self) -> None:
+        """Deliver queued embeds in batches until the outbox is closed and empty."""
+
+        while True:
+            await self.pending.wait()
+
+            rows: list[tuple[int, str, str]] = sorted(self.Claim())
+
+            if not rows:
+                self.pending.clear()
+
+                if self.closing:
+                    return
+
+                continue
+
+            # Imported only once there is something to deliver, as it is
+            # among the slowest of Moniker's dependencies to import.
+            from discord_webhook import DiscordWebhook
+
+            url: str = rows[0][1]
+            embeds: list[dict[str, Any]] = [json.loads(row[2]) for row in rows]
+            start: float = perf_counter()
+
+            try:
+                # Webhook execution is blocking and may sleep when Discord
+                # rate limits the request, so keep it off the event loop.
+                res: Any = await asyncio.to_thread(
+                    DiscordWebhook(
+                        url=url, embeds=embeds, rate_limit_retry=True
+                    ).execute
+                )
+
+                res.raise_for_status()
+            except Exception as e:
+                metrics.notification_duration.Observe(perf_counter() - start)
+                metrics.notifications.Inc(len(embeds), result="failed")
+
+                logger.opt(exception=e).error(
+                    f"Failed to deliver {len(embeds):,} notifications, retrying in {self.backoff}s"
+                )
+
+                self.db.execute(
+                    f"UPDATE outbox SET claimed = NULL WHERE id IN ({','.join('?' * len(rows))})",
+                    [row[0] for row in rows],
+                )
+
+                if self.closing:
+                    return
+
+                await asyncio.sleep(self.backoff)
+
+                continue
+
+            metrics.notification_duration.Observe(perf_counter() - start)
+            metrics.notifications.Inc(len(embeds), result="delivered")
+
+            self.db.execute(
+                f"DELETE FROM outbox WHERE id IN ({','.join('?' * len(rows))})",
+                [row[0] for row in rows],
+            )
+
+            logger.debug(f"Delivered {len(embeds):,} notifications to Discord webhook")
+
+    def Claim(self: Self) -> list[tuple[int, str, str]]:
+        """
+        Claim the next batch of unclaimed embeds for a single webhook, so
+        that workers sharing the outbox never deliver the same embed twice.
+        """
+
+        now: float = time()
+
+        return self.db.execute(
+            """
+            UPDATE outbox SET claimed = ? WHERE id IN (
+                SELECT id FROM outbox
+                WHERE (claimed IS NULL OR claimed < ?) AND url = (
+                    SELECT url FROM outbox WHERE claimed IS NULL OR claimed < ?
+                    ORDER BY id LIMIT 1
+                )
+                ORDER BY id LIMIT ?
+            )
+            RETURNING id, url, embed
+            """,
+            (now, now - LEASE, now - LEASE, EMBED_LIMIT),
+        ).fetchall()
+
+    async def Close(self: Self) -> None:
+        """
+        Deliver any remaining embeds, then stop the worker and close the
+        outbox. Undelivered embeds remain persisted for the next run.
+        """
+
+        self.closing = True
+        self.pending.set()
+
+        if self.worker:
+            await self.worker
+
+        self.db.close()
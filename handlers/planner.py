@@ -0,0 +1,143 @@
+from math import inf
+from os import environ
+from time import monotonic, time
+from typing import Any, Self
+
+from loguru import logger
+
+from .config import Setting
+from .state import State
+
+# Factor applied to the check frequency of each priority tier.
+TIERS: dict[str, float] = {"high": 4.0, "normal": 1.0, "low": 0.25}
+
+
+class Planner:
+    """
+    Assign each username of a service its own check interval so that the
+    request budget is spent where a release is most likely to be caught.
+    A username is checked more often the higher its configured priority
+    tier and the more often its availability has changed in the past. The
+    total request rate is then capped by the service's rate limit and the
+    throughput allowed by its concurrency limit and measured latency, with
+    every interval stretched evenly should the plan exceed it.
+    """
+
+    def __init__(self: Self, state: State, service: Any, usernames: list[str]) -> None:
+        """Initialize a plan for the provided usernames of a service."""
+
+        self.state: State = state
+        self.service: Any = service
+        self.usernames: list[str] = usernames
+        self.intervals: dict[str, float] = {}
+        self.planned: float | None = None
+
+    def Priorities(self: Self) -> dict[str, set[str]]:
+        """
+        Fetch the usernames configured in the service's <PREFIX>_HIGH_PRIORITY
+        and <PREFIX>_LOW_PRIORITY lists, normalized as they are by Prefilter.
+        """
+
+        priorities: dict[str, set[str]] = {}
+
+        for tier in ("high", "low"):
+            names: set[str] = {
+                name.strip().lstrip("@$")
+                for name in environ.get(
+                    f"{self.service.prefix}_{tier.upper()}_PRIORITY", ""
+                ).split(",")
+            }
+
+            if self.service.insensitive:
+                names = {name.casefold() for name in names}
+
+            priorities[tier] = names - {""}
+
+        return priorities
+
+    def Plan(self: Self) -> None:
+        """Compute the check interval of every username."""
+
+        prefix: str = self.service.prefix
+        name: str = type(self.service).__name__
+        interval: float = Setting("INTERVAL", 300.0, prefix)
+        floor: float = Setting("INTERVAL_MIN", 30.0, prefix)
+        ceiling: float = Setting("INTERVAL_MAX", 86400.0, prefix)
+
+        priorities: dict[str, set[str]] = self.Priorities()
+        weights: dict[str, float] = {}
+
+        for username in self.usernames:
+            previous: dict[str, Any] | None = self.state.Get(name, username)
+
+            # Usernames which have never been checked are weighted as though
+            # they had changed once, so that they are resolved promptly.
+            changes: int = previous["changes"] if previous else 1
+
+            # Expanded usernames (e.g. user@instance) share the tier of the
+            # configured username they were expanded from.
+            base: str = username.partition("@")[0]
+            tier: str = next(
+                (
+                    tier
+                    for tier, names in priorities.items()
+                    if username in names or base in names
+                ),
+                "normal",
+            )
+
+            weights[username] = TIERS[tier] * (1 + min(changes, 9))
+
+        # Services which support bulk lookups resolve many usernames with
+        # each request.
+        cost: float = 1 / self.service.batch if self.service.batch else 1.0
+        limit: float = Setting("RATE_LIMIT", 10.0, prefix)
+
+        # A non-positive rate limit disables throttling, leaving the budget
+        # bounded only by the service's throughput.
+        budget: float = (
+            limit * Setting("SCHEDULE_BUDGET", 0.5, prefix) if limit > 0 else inf
+        )
+
+        if latency := self.state.GetServiceLatency(name):
+            concurrency: int = int(environ.get(f"{prefix}_CONCURRENCY_LIMIT", 8))
+            budget = min(budget, concurrency / latency)
+
+        rate: float = sum(weights.values()) / interval * cost
+        scale: float = max(rate / budget, 1.0) if budget > 0 else 1.0
+
+        self.intervals = {
+            username: min(max(interval / weight * scale, floor), ceiling)
+            for username, weight in weights.items()
+        }
+        self.planned = monotonic()
+
+        logger.debug(
+            "Planned {:,} {} {}s at {:,.2f} requests/s of a {:,.2f} requests/s budget",
+            len(self.intervals),
+            self.service.name,
+            self.service.label,
+            sum(1 / value for value in self.intervals.values()) * cost,
+            budget,
+        )
+
+    def Interval(self: Self, username: str) -> float:
+        """Fetch the check interval of a username, replanning periodically."""
+
+        if self.planned is None or monotonic() - self.planned >= Setting(
+            "SCHEDULE_REPLAN", 60.0, self.service.prefix
+        ):
+            self.Plan()
+
+        return self.intervals.get(
+            username, Setting("INTERVAL", 300.0, self.service.prefix)
+        )
+
+    def IsDue(self: Self, username: str) -> bool:
+        """Determine if a username's check interval has elapsed since it was last checked."""
+
+        previous: dict[str, Any] | None = self.state.Get(
+            type(self.service).__name__, username
+        )
+
+        return not previous or time() - previous["checked"] >= self.Interval(username)
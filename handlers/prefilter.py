@@ -0,0 +1,62 @@
+from re import Pattern
+from typing import Any
+
+from loguru import logger
+
+
+def Normalize(service: Any, username: str) -> str:
+    """Normalize a username as configured (e.g. " @Name ") to its canonical form."""
+
+    # Tolerate whitespace and platform sigils in the configured list.
+    username = username.strip().lstrip("@$")
+
+    if service.insensitive:
+        username = username.casefold()
+
+    return username
+
+
+def IsValid(service: Any, username: str) -> bool:
+    """Determine if a normalized username satisfies the service's validation rules."""
+
+    pattern: Pattern | None = service.pattern
+
+    if pattern and not pattern.fullmatch(username):
+        return False
+
+    return username not in service.reserved
+
+
+def Prefilter(service: Any, usernames: list[str]) -> tuple[list[str], list[str]]:
+    """
+    Normalize and deduplicate usernames, then split them into those which
+    satisfy the service's validation rules and those which could never be
+    registered, so that no request is made for the latter.
+
+    Services declare their rules using the pattern (full match), reserved
+    (exact names which cannot be registered), and insensitive (whether
+    usernames are case-insensitive) attributes.
+    """
+
+    valid: list[str] = []
+    invalid: list[str] = []
+    seen: set[str] = set()
+
+    for username in usernames:
+        username = Normalize(service, username)
+
+        if not username or username in seen:
+            continue
+
+        seen.add(username)
+
+        if IsValid(service, username):
+            valid.append(username)
+        else:
+            invalid.append(username)
+
+    if invalid:
+        logger.warning(f"Skipping {len(invalid):,} invalid {service.name} usernames")
+        logger.debug(f"Invalid {service.name} usernames: {', '.join(invalid)}")
+
+    return valid, invalid
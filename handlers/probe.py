@@ -0,0 +1,56 @@
+from httpx import AsyncClient, Response
+from loguru import logger
+
+# HTTP status codes returned by hosts which do not honor HEAD requests,
+# in which case the result is confirmed using a GET request.
+HEAD_UNSUPPORTED: tuple[int, ...] = (403, 405, 501)
+
+# Maximum number of bytes of an HTTP/1.1 response body which are read (and
+# discarded) so that its connection may be reused. Closing an HTTP/1.1
+# response before its body has been read closes the connection, whereas
+# an HTTP/2 stream can be reset without affecting the connection.
+DRAIN_LIMIT: int = 64 * 1024
+
+
+async def Probe(
+    client: AsyncClient, url: str, method: str = "GET", follow_redirects: bool = False
+) -> Response:
+    """
+    Determine the HTTP status of a URL without downloading the response
+    body. HEAD is used when requested, otherwise the response is streamed
+    and closed once the headers have been received and, for small HTTP/1.1
+    responses, the body drained so that the connection may be reused.
+    """
+
+    if method == "HEAD":
+        res: Response = await client.head(url, follow_redirects=follow_redirects)
+
+        if res.status_code not in HEAD_UNSUPPORTED:
+            logger.trace("HTTP {} HEAD {}", res.status_code, res.url)
+
+            return res
+
+        logger.trace("HTTP {} HEAD {}, confirming with GET", res.status_code, res.url)
+
+    # Exiting the stream context closes the response, discarding the rest of
+    # the body. The status and headers remain available. Small bodies are
+    # read first so that the connection returns to the pool, as a new TCP
+    # and TLS handshake costs more than a few kilobytes of transfer.
+    async with client.stream("GET", url, follow_redirects=follow_redirects) as res:
+        logger.trace("HTTP {} GET {}", res.status_code, res.url)
+
+        length: str | None = res.headers.get("Content-Length")
+
+        # Responses served from the cache have already been read.
+        if (
+            not res.is_stream_consumed
+            and res.http_version != "HTTP/2"
+            and (length is None or (length.isdigit() and int(length) <= DRAIN_LIMIT))
+        ):
+            drained: int = 0
+
+            async for chunk in res.aiter_raw():
+                if (drained := drained + len(chunk)) > DRAIN_LIMIT:
+                    break
+
+    return res
@@ -0,0 +1,121 @@
+import json
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any
+
+from loguru import logger
+
+# Phases of a request, keyed by the httpcore trace event which measures
+# them. Name resolution happens while connecting, as does the HTTP/2
+# connection preface, so both are part of connect. Responses which are
+# closed without reading the body (see Probe) have no download phase.
+PHASES: dict[str, str] = {
+    "connect_tcp": "connect",
+    "send_connection_init": "connect",
+    "start_tls": "tls",
+    "send_request_headers": "send",
+    "send_request_body": "upload",
+    "receive_response_headers": "wait",
+    "receive_response_body": "download",
+}
+
+# Durations of each phase, keyed by service then phase. Timings are only
+# recorded once profiling has been enabled (see Enable).
+timings: defaultdict[str, defaultdict[str, list[float]]] | None = None
+
+
+def Enable() -> None:
+    """Begin recording phase timings."""
+
+    global timings
+
+    timings = defaultdict(lambda: defaultdict(list))
+
+
+def Record(service: str, phase: str, duration: float) -> None:
+    """Record the duration of a phase, if profiling is enabled."""
+
+    if timings is not None:
+        timings[service][phase].append(duration)
+
+
+@contextmanager
+def Measure(service: str, phase: str) -> Iterator[None]:
+    """Record the duration of the enclosed block as a phase of a service."""
+
+    if timings is None:
+        yield
+
+        return
+
+    start: float = perf_counter()
+
+    try:
+        yield
+    finally:
+        Record(service, phase, perf_counter() - start)
+
+
+def Trace(service: str) -> Callable[[str, dict[str, Any]], Awaitable[None]]:
+    """
+    Build an httpx trace extension which records the duration of each
+    phase of a request (see PHASES) as it completes.
+    """
+
+    started: dict[str, float] = {}
+
+    async def Hook(event: str, info: dict[str, Any]) -> None:
+        name, _, status = event.rpartition(".")
+        phase: str | None = PHASES.get(name.rpartition(".")[2])
+
+        if not phase:
+            return
+
+        if status == "started":
+            started[name] = perf_counter()
+        elif (start := started.pop(name, None)) is not None:
+            Record(service, phase, perf_counter() - start)
+
+    return Hook
+
+
+def Percentile(values: list[float], q: float) -> float:
+    """Compute the q-th percentile (0-100) of a list of values."""
+
+    ordered: list[float] = sorted(values)
+
+    return ordered[min(int(len(ordered) * q / 100), len(ordered) - 1)]
+
+
+def Report() -> None:
+    """Log the count and duration of each phase of every service."""
+
+    if not timings:
+        logger.info("Profile recorded no timings")
+
+        return
+
+    for service, phases in sorted(timings.items()):
+        logger.info(f"Profile of {service}")
+
+        for phase, durations in sorted(
+            phases.items(), key=lambda item: sum(item[1]), reverse=True
+        ):
+            logger.info(
+                f"  {phase:<10} {len(durations):>8,} x  total {sum(durations):>9.3f}s  "
+                f"mean {sum(durations) / len(durations) * 1000:>8.2f}ms  "
+                f"p50 {Percentile(durations, 50) * 1000:>8.2f}ms  "
+                f"p95 {Percentile(durations, 95) * 1000:>8.2f}ms  "
+                f"max {max(durations) * 1000:>8.2f}ms"
+            )
+
+
+def Dump(path: str) -> None:
+    """Write every recorded timing to a JSON file."""
+
+    with open(path, "w") as file:
+        json.dump(timings or {}, file)
+
+    logger.success(f"Wrote profile timings to {path}")
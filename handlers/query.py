@@ -0,0 +1,287 @@
+import asyncio
+import json
+from asyncio import Server, StreamReader, StreamWriter, Task
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from functools import partial
+from time import monotonic
+from typing import Any, Self
+from urllib.parse import SplitResult, parse_qs, urlsplit
+
+from loguru import logger
+
+from . import metrics
+
+# Maximum size of a request body, and of the queries (services multiplied
+# by usernames) in a single request.
+BODY_LIMIT: int = 1 << 20
+QUERY_LIMIT: int = 1000
+
+# Outcomes which are reused for the cache TTL. Others (e.g. errors) are
+# retried by the next query.
+CACHEABLE: tuple[str, ...] = ("available", "unavailable", "invalid")
+
+
+class Memo:
+    """
+    Cache of lookups which coalesces identical lookups in progress, so that
+    concurrent queries for the same username share a single check, and
+    reuses their results for a TTL. The least recently used results are
+    evicted once the cache is full.
+    """
+
+    def __init__(
+        self: Self, ttl: float, size: int, cacheable: Callable[[Any], bool]
+    ) -> None:
+        """Initialize an empty cache."""
+
+        self.ttl: float = ttl
+        self.size: int = size
+        self.cacheable: Callable[[Any], bool] = cacheable
+        self.values: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.lookups: dict[Hashable, Task] = {}
+
+    async def Get(
+        self: Self, key: Hashable, lookup: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, bool]:
+        """
+        Fetch the result of a lookup, and whether it was served from the
+        cache. The lookup runs only if it is neither cached nor in progress.
+        """
+
+        if (entry := self.values.get(key)) and entry[0] > monotonic():
+            self.values.move_to_end(key)
+
+            return entry[1], True
+
+        if not (task := self.lookups.get(key)):
+            task = self.lookups[key] = asyncio.create_task(lookup())
+            task.add_done_callback(partial(self.Store, key))
+
+        # A client which disconnects must not cancel a lookup which other
+        # clients are awaiting.
+        return await asyncio.shield(task), False
+
+    def Store(self: Self, key: Hashable, task: Task) -> None:
+        """Cache the result of a completed lookup."""
+
+        self.lookups.pop(key, None)
+
+        if self.ttl <= 0 or task.cancelled() or task.exception():
+            return
+
+        if not self.cacheable(result := task.result()):
+            return
+
+        self.values[key] = (monotonic() + self.ttl, result)
+        self.values.move_to_end(key)
+
+        while len(self.values) > self.size:
+            self.values.popitem(last=False)
+
+
+class QueryServer:
+    """
+    Local HTTP server which answers availability queries on demand. Each
+    query is fanned out to every requested service concurrently using the
+    long-lived service clients, so that connections are reused across
+    queries.
+
+    GET /check?usernames=a,b&services=github,venmo
+    POST /check {"usernames": ["a", "b"], "services": ["github", "venmo"]}
+
+    Services default to every supported service. Prometheus metrics are
+    also served at /metrics.
+    """
+
+    def __init__(
+        self: Self,
+        lookup: Callable[[str, str], Awaitable[list[dict[str, Any]]]],
+        normalize: Callable[[str, str], str],
+        services: list[str],
+        ttl: float,
+        size: int,
+    ) -> None:
+        """
+        Initialize a server which answers queries using lookup, which checks
+        a username on the service with the provided prefix. Usernames are
+        normalized for the service first, so that queries which differ only
+        in form (e.g. case) share a check and its cached result.
+        """
+
+        self.lookup: Callable[[str, str], Awaitable[list[dict[str, Any]]]] = lookup
+        self.normalize: Callable[[str, str], str] = normalize
+        self.services: list[str] = services
+        self.memo: Memo = Memo(
+            ttl,
+            size,
+            lambda records: all(record["outcome"] in CACHEABLE for record in records),
+        )
+
+    async def Serve(self: Self, host: str, port: int) -> Server:
+        """Answer queries for as long as the returned server runs."""
+
+        server: Server = await asyncio.start_server(self.Connection, host, port)
+
+        logger.success(f"Serving availability queries at http://{host}:{port}/check")
+
+        return server
+
+    async def Connection(
+        self: Self, reader: StreamReader, writer: StreamWriter
+    ) -> None:
+        """Serve the requests of a connection until the client closes it."""
+
+        try:
+            while line := await reader.readline():
+                parts: list[str] = line.decode("latin-1").split()
+                headers: dict[str, str] = {}
+
+                while (header := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = header.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                if len(parts) != 3:
+                    await self.Respond(writer, 400, {"error": "malformed request"})
+
+                    break
+
+                method, target, version = parts
+                length: int = int(headers.get("content-length") or 0)
+
+                if length > BODY_LIMIT:
+                    await self.Respond(writer, 413, {"error": "request too large"})
+
+                    break
+
+                body: bytes = await reader.readexactly(length) if length else b""
+                try:
+                    status, payload = await self.Route(method, target, body)
+                except Exception as e:
+                    logger.opt(exception=e).error(f"Failed to answer {method} {target}")
+
+                    status, payload = 500, {"error": "internal error"}
+
+                await self.Respond(writer, status, payload)
+
+                if (
+                    headers.get("connection", "").lower() == "close"
+                    or version == "HTTP/1.0"
+                ):
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def Route(
+        self: Self, method: str, target: str, body: bytes
+    ) -> tuple[int, Any]:
+        """Answer a request, returning its status and payload."""
+
+        url: SplitResult = urlsplit(target)
+
+        if url.path == "/metrics" and method == "GET":
+            return 200, metrics.Render()
+
+        if url.path != "/check":
+            return 404, {"error": "not found"}
+
+        if method == "GET":
+            query: dict[str, list[str]] = parse_qs(url.query)
+            usernames: list[str] = [
+                username
+                for value in query.get("usernames", []) + query.get("username", [])
+                for username in value.split(",")
+            ]
+            services: list[str] = [
+                service
+                for value in query.get("services", []) + query.get("service", [])
+                for service in value.split(",")
+            ]
+        elif method == "POST":
+            try:
+                data: Any = json.loads(body)
+            except ValueError:
+                return 400, {"error": "expected a JSON object"}
+
+            if not isinstance(data, dict):
+                return 400, {"error": "expected a JSON object"}
+
+            usernames = data.get("usernames", [])
+            services = data.get("services", [])
+
+            # A string is iterable, so it would otherwise be checked as
+            # though each of its characters were a username.
+            for field, values in (("usernames", usernames), ("services", services)):
+                if not isinstance(values, list) or not all(
+                    isinstance(value, str) for value in values
+                ):
+                    return 400, {"error": f"expected {field} to be a list of strings"}
+        else:
+            return 405, {"error": "method not allowed"}
+
+        usernames = [username.strip() for username in usernames if username.strip()]
+        services = [
+            service.strip().upper() for service in services if service.strip()
+        ] or self.services
+
+        if not usernames:
+            return 400, {"error": "no usernames provided"}
+
+        if unknown := [service for service in services if service not in self.services]:
+            return 400, {"error": f"unknown services: {', '.join(unknown)}"}
+
+        if len(usernames) * len(services) > QUERY_LIMIT:
+            return 400, {"error": f"more than {QUERY_LIMIT:,} queries in one request"}
+
+        return 200, {"results": await self.Query(services, usernames)}
+
+    async def Query(
+        self: Self, services: list[str], usernames: list[str]
+    ) -> list[dict[str, Any]]:
+        """Check every username on every service concurrently."""
+
+        keys: list[tuple[str, str]] = [
+            (service, self.normalize(service, username))
+            for service in services
+            for username in usernames
+        ]
+        answers: list[tuple[list[dict[str, Any]], bool]] = await asyncio.gather(
+            *(self.memo.Get(key, partial(self.lookup, *key)) for key in keys)
+        )
+
+        return [
+            {**record, "cached": cached}
+            for records, cached in answers
+            for record in records
+        ]
+
+    async def Respond(
+        self: Self, writer: StreamWriter, status: int, payload: Any
+    ) -> None:
+        """Write a response, as JSON unless the payload is text."""
+
+        kind: str = "application/json"
+
+        if isinstance(payload, str):
+            body: bytes = payload.encode()
+            kind = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            body = json.dumps(payload, separators=(",", ":")).encode()
+
+        reasons: dict[int, str] = {
+            200: "OK",
+            400: "Bad Request",
+            404: "Not Found",
+            405: "Method Not Allowed",
+            413: "Content Too Large",
+            500: "Internal Server Error",
+        }
+
+        writer.write(
+            f"HTTP/1.1 {status} {reasons[status]}\r\nContent-Type: {kind}\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+            + body
+        )
+
+        await writer.drain()
@@ -0,0 +1,216 @@
+import asyncio
+import random
+from asyncio import Lock
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic, time
+from typing import Self
+
+from httpx import AsyncBaseTransport, Request, Response
+from loguru import logger
+
+# HTTP status codes which indicate that the request should be retried
+# after backing off.
+RETRY_STATUSES: tuple[int, ...] = (429, 503)
+
+
+class TokenBucket:
+    """
+    Asynchronous token bucket which limits the rate of requests to a host,
+    and which may be blocked entirely until a host-provided reset time.
+    """
+
+    def __init__(self: Self, rate: float, burst: int) -> None:
+        """Initialize a full token bucket."""
+
+        self.rate: float = rate
+        self.burst: int = max(burst, 1)
+        self.tokens: float = self.burst
+        self.updated: float = monotonic()
+        self.blocked: float = 0.0
+        self.lock: Lock = Lock()
+
+    async def Acquire(self: Self) -> None:
+        """Wait until a token is available, then consume it."""
+
+        async with self.lock:
+            while True:
+                now: float = monotonic()
+
+                if now < self.blocked:
+                    await asyncio.sleep(self.blocked - now)
+
+                    continue
+
+                # A non-positive rate disables throttling, but the bucket
+                # still honors blocks requested by the host.
+                if self.rate <= 0:
+                    return
+
+                self.tokens = min(
+                    self.burst, self.tokens + ((now - self.updated) * self.rate)
+                )
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def TryAcquire(self: Self) -> bool:
+        """
+        Consume a token only if one is available now, without waiting. This
+        fails while the bucket is blocked or other requests await a token.
+        """
+
+        now: float = monotonic()
+
+        if now < self.blocked or self.lock.locked():
+            return False
+
+        if self.rate <= 0:
+            return True
+
+        self.tokens = min(self.burst, self.tokens + ((now - self.updated) * self.rate))
+        self.updated = now
+
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+
+        return True
+
+    def Block(self: Self, seconds: float) -> None:
+        """Prevent any tokens from being acquired for the provided duration."""
+
+        self.blocked = max(self.blocked, monotonic() + seconds)
+
+
+# Token buckets are keyed by host and shared by every client, so that all
+# checks against a host draw from the same budget.
+buckets: dict[str, TokenBucket] = {}
+
+
+def GetBucket(host: str, rate: float, burst: int) -> TokenBucket:
+    """Fetch the token bucket for a host, creating it if necessary."""
+
+    if not (bucket := buckets.get(host)):
+        bucket = TokenBucket(rate, burst)
+        buckets[host] = bucket
+
+    return bucket
+
+
+def ParseReset(value: str) -> float | None:
+    """
+    Parse a rate limit reset header into the number of seconds to wait.
+    Supports delta-seconds, epoch seconds, HTTP-dates, and ISO 8601
+    timestamps (as used by Mastodon).
+    """
+
+    try:
+        number: float = float(value)
+
+        # Values larger than a year are treated as epoch timestamps.
+        return max(number - time(), 0.0) if number > 31536000 else max(number, 0.0)
+    except ValueError:
+        pass
+
+    for parse in (parsedate_to_datetime, datetime.fromisoformat):
+        try:
+            moment: datetime = parse(value)
+        except (TypeError, ValueError):
+            continue
+
+        if not moment.tzinfo:
+            moment = moment.replace(tzinfo=timezone.utc)
+
+        return max((moment - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    return None
+
+
+class RateLimit(AsyncBaseTransport):
+    """
+    Transport which throttles requests using per-host token buckets, honors
+    Retry-After and X-RateLimit-* headers, and retries throttled requests
+    with exponential backoff and jitter.
+    """
+
+    def __init__(
+        self: Self,
+        transport: AsyncBaseTransport,
+        rate: float,
+        burst: int,
+        retries: int,
+        backoff: float,
+        ceiling: float,
+    ) -> None:
+        """Wrap the provided transport with rate limiting."""
+
+        self.transport: AsyncBaseTransport = transport
+        self.rate: float = rate
+        self.burst: int = burst
+        self.retries: int = retries
+        self.backoff: float = backoff
+        self.ceiling: float = ceiling
+
+    async def handle_async_request(self: Self, request: Request) -> Response:
+        """Send a request once a token is available, retrying if throttled."""
+
+        bucket: TokenBucket = GetBucket(request.url.host, self.rate, self.burst)
+        attempt: int = 0
+
+        while True:
+            await bucket.Acquire()
+
+            res: Response = await self.transport.handle_async_request(request)
+
+            if res.headers.get("X-RateLimit-Remaining") == "0":
+                if reset := res.headers.get("X-RateLimit-Reset"):
+                    if (pause := ParseReset(reset)) is not None:
+                        bucket.Block(min(pause, self.ceiling))
+
+                        logger.debug(
+                            "Exhausted rate limit for {}, pausing for {:.2f}s",
+                            request.url.host,
+                            pause,
+                        )
+
+            if res.status_code not in RETRY_STATUSES or attempt >= self.retries:
+                return res
+
+            delay: float | None = None
+
+            if after := res.headers.get("Retry-After"):
+                delay = ParseReset(after)
+
+            # Without guidance from the host, use exponential backoff with
+            # full jitter to avoid synchronized retries.
+            if delay is None:
+                delay = random.uniform(0, self.backoff * (2**attempt))
+
+            delay = min(delay, self.ceiling)
+            attempt += 1
+
+            bucket.Block(delay)
+
+            await res.aclose()
+
+            logger.warning(
+                "HTTP {} {} {}, retrying in {:.2f}s (attempt {}/{})",
+                res.status_code,
+                request.method,
+                request.url,
+                delay,
+                attempt,
+                self.retries,
+            )
+
+    async def aclose(self: Self) -> None:
+        """Close the wrapped transport."""
+
+        await self.transport.aclose()
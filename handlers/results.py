@@ -0,0 +1,114 @@
+import csv
+import json
+from contextvars import ContextVar
+from csv import DictWriter
+from time import time
+from typing import IO, Any, Self
+
+from loguru import logger
+
+# Fields of every result record, in the order they are written.
+FIELDS: tuple[str, ...] = (
+    "service",
+    "username",
+    "outcome",
+    "status",
+    "latency",
+    "timestamp",
+)
+
+# Details of the check in progress in the current task, which services fill
+# in as they determine availability (see Note).
+current: ContextVar[dict[str, Any] | None] = ContextVar("result", default=None)
+
+
+def Begin() -> dict[str, Any]:
+    """Begin recording the details of a check in the current task."""
+
+    detail: dict[str, Any] = {"outcome": None, "status": None}
+
+    current.set(detail)
+
+    return detail
+
+
+def Note(**values: Any) -> None:
+    """
+    Record details (such as the HTTP status or outcome) of the check in
+    progress. This does nothing outside of a check.
+    """
+
+    if (detail := current.get()) is not None:
+        detail.update(values)
+
+
+def Outcome(available: bool | None, detail: dict[str, Any]) -> str:
+    """
+    Determine the outcome of a check. A check which could not determine
+    availability is an error, unless it received an unexpected HTTP status
+    or its service recorded a more specific outcome (e.g. skipped).
+    """
+
+    if available is not None:
+        return "available" if available else "unavailable"
+
+    if outcome := detail.get("outcome"):
+        return outcome
+
+    return "unexpected" if detail.get("status") else "error"
+
+
+def Record(
+    service: str,
+    username: str,
+    outcome: str,
+    status: int | None,
+    latency: float | None,
+) -> dict[str, Any]:
+    """Build the record of a check, timestamped now."""
+
+    return {
+        "service": service,
+        "username": username,
+        "outcome": outcome,
+        "status": status,
+        "latency": round(latency, 6) if latency is not None else None,
+        "timestamp": round(time(), 3),
+    }
+
+
+class Results:
+    """
+    Sink which streams a record of every check to a JSON Lines or CSV file
+    (chosen by its extension) as it is produced, so that memory use does not
+    grow with the number of usernames checked. Records are appended, so that
+    a file may accumulate the results of many runs.
+    """
+
+    def __init__(self: Self, path: str) -> None:
+        """Open (and create, if necessary) the results file."""
+
+        self.path: str = path
+        self.file: IO[str] = open(path, "a", buffering=1, newline="", encoding="utf-8")
+        self.writer: DictWriter | None = None
+
+        if path.lower().endswith(".csv"):
+            self.writer = csv.DictWriter(self.file, FIELDS)
+
+            if not self.file.tell():
+                self.writer.writeheader()
+
+        logger.debug(f"Streaming check results to {path}")
+
+    def Write(self: Self, record: dict[str, Any]) -> None:
+        """Append a result record."""
+
+        if self.writer:
+            self.writer.writerow(record)
+        else:
+            self.file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def Close(self: Self) -> None:
+        """Close the results file."""
+
+        self.file.close()
@@ -0,0 +1,65 @@
+import asyncio
+from asyncio import Task
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Self
+
+from loguru import logger
+
+# A job is a coroutine function to execute and a callable which returns
+# the number of seconds to wait between executions. The interval is
+# resolved before every sleep so that configuration changes apply to
+# jobs which are already scheduled.
+Job = tuple[Callable[[], Awaitable[None]], Callable[[], float]]
+
+
+class Scheduler:
+    """Manage a set of keyed, periodically executed asynchronous jobs."""
+
+    def __init__(self: Self) -> None:
+        """Initialize an empty scheduler."""
+
+        self.tasks: dict[Hashable, Task] = {}
+
+    def Sync(self: Self, jobs: dict[Hashable, Job]) -> None:
+        """
+        Schedule any jobs which are not yet running and cancel any running
+        jobs which are no longer present, leaving all other jobs untouched.
+        """
+
+        for key in self.tasks.keys() - jobs.keys():
+            self.tasks.pop(key).cancel()
+
+            logger.info(f"Unscheduled job {key}")
+
+        for key in jobs.keys() - self.tasks.keys():
+            self.tasks[key] = asyncio.create_task(self.Run(key, *jobs[key]))
+
+            logger.info(f"Scheduled job {key}")
+
+    async def Run(
+        self: Self,
+        key: Hashable,
+        func: Callable[[], Awaitable[None]],
+        interval: Callable[[], float],
+    ) -> None:
+        """Execute a job repeatedly, waiting the job interval between executions."""
+
+        while True:
+            try:
+                await func()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.opt(exception=e).error(f"Failed to execute job {key}")
+
+            await asyncio.sleep(interval())
+
+    async def Stop(self: Self) -> None:
+        """Cancel all scheduled jobs and wait for them to exit."""
+
+        for task in self.tasks.values():
+            task.cancel()
+
+        await asyncio.gather(*self.tasks.values(), return_exceptions=True)
+
+        self.tasks.clear()
@@ -0,0 +1,46 @@
+from hashlib import blake2b
+
+
+def ParseShard(value: str) -> tuple[int, int]:
+    """Parse a shard of the form i/N, where shards are numbered from 1 to N."""
+
+    index, _, count = value.partition("/")
+
+    try:
+        shard: tuple[int, int] = (int(index), int(count))
+    except ValueError:
+        raise ValueError(f"Invalid shard {value!r}, expected i/N (e.g. 1/3)") from None
+
+    if not 1 <= shard[0] <= shard[1]:
+        raise ValueError(f"Invalid shard {value!r}, expected 1 <= i <= N")
+
+    return shard
+
+
+def Owner(service: str, username: str, count: int) -> int:
+    """
+    Determine which of count shards owns a (service, username) pair using
+    rendezvous hashing, so that every worker agrees on the owner without
+    coordination and changing the number of shards only moves the pairs
+    owned by the shards which were added or removed.
+    """
+
+    return max(
+        range(1, count + 1),
+        key=lambda shard: blake2b(
+            f"{shard}:{service}:{username}".encode(), digest_size=8
+        ).digest(),
+    )
+
+
+def Shard(service: str, usernames: list[str], shard: tuple[int, int]) -> list[str]:
+    """Filter usernames to those owned by the provided shard."""
+
+    index, count = shard
+
+    if count == 1:
+        return usernames
+
+    return [
+        username for username in usernames if Owner(service, username, count) == index
+    ]
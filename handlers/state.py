@@ -0,0 +1,210 @@
+import sqlite3
+from sqlite3 import Connection
+from time import time
+from typing import Any, Self
+
+from loguru import logger
+
+
+class State:
+    """
+    Persistent, SQLite-backed store of the last known availability of each
+    (service, username) pair, used to notify only on status transitions.
+    """
+
+    def __init__(self: Self, path: str, history: int = 100) -> None:
+        """Open (and create, if necessary) the state database."""
+
+        self.history: int = history
+        self.db: Connection = sqlite3.connect(path, timeout=30.0, isolation_level=None)
+
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS usernames (
+                service TEXT NOT NULL,
+                username TEXT NOT NULL,
+                available INTEGER NOT NULL,
+                checked REAL NOT NULL,
+                changed REAL NOT NULL,
+                changes INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (service, username)
+            )
+            """
+        )
+
+        # State recorded before changes were counted lacks the column.
+        if "changes" not in [
+            row[1] for row in self.db.execute("PRAGMA table_info(usernames)")
+        ]:
+            self.db.execute(
+                "ALTER TABLE usernames ADD COLUMN changes INTEGER NOT NULL DEFAULT 0"
+            )
+
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS latency (
+                service TEXT NOT NULL,
+                username TEXT NOT NULL,
+                checked REAL NOT NULL,
+                latency REAL NOT NULL
+            )
+            """
+        )
+        self.db.execute(
+            "CREATE INDEX IF NOT EXISTS latency_key ON latency (service, username, checked)"
+        )
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sweeps (
+                service TEXT NOT NULL,
+                signature TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                updated REAL NOT NULL,
+                PRIMARY KEY (service, signature)
+            )
+            """
+        )
+
+        logger.debug(f"Opened state database {path}")
+
+    def Get(self: Self, service: str, username: str) -> dict[str, Any] | None:
+        """Fetch the last recorded state of a username, if any."""
+
+        row: tuple[int, float, float, int] | None = self.db.execute(
+            "SELECT available, checked, changed, changes FROM usernames WHERE service = ? AND username = ?",
+            (service, username),
+        ).fetchone()
+
+        if not row:
+            return None
+
+        return {
+            "available": bool(row[0]),
+            "checked": row[1],
+            "changed": row[2],
+            "changes": row[3],
+        }
+
+    def GetLatency(self: Self, service: str, username: str) -> list[float]:
+        """Fetch the recorded latency history of a username, oldest first."""
+
+        rows: list[tuple[float]] = self.db.execute(
+            "SELECT latency FROM latency WHERE service = ? AND username = ? ORDER BY checked",
+            (service, username),
+        ).fetchall()
+
+        return [row[0] for row in rows]
+
+    def GetServiceLatency(self: Self, service: str, sample: int = 1000) -> float | None:
+        """Fetch the mean latency of a service's most recent checks, if any."""
+
+        return self.db.execute(
+            "SELECT AVG(latency) FROM (SELECT latency FROM latency WHERE service = ? ORDER BY checked DESC LIMIT ?)",
+            (service, sample),
+        ).fetchone()[0]
+
+    def IsFresh(self: Self, service: str, username: str, window: float) -> bool:
+        """Determine if a username was checked within the provided window (seconds)."""
+
+        if window <= 0:
+            return False
+
+        if not (state := self.Get(service, username)):
+            return False
+
+        return (time() - state["checked"]) < window
+
+    def Record(
+        self: Self, service: str, username: str, available: bool, latency: float
+    ) -> bool:
+        """
+        Record the result of a check. Returns True if the availability of
+        the username differs from the previously recorded state, or if the
+        username has not been recorded before.
+        """
+
+        # The previous state is read within an immediate transaction so that
+        # workers sharing the database never both observe the same change.
+        self.db.execute("BEGIN IMMEDIATE")
+
+        now: float = time()
+        previous: dict[str, Any] | None = self.Get(service, username)
+        changed: bool = previous is None or previous["available"] != available
+
+        self.db.execute(
+            """
+            INSERT INTO usernames (service, username, available, checked, changed)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (service, username) DO UPDATE SET
+                available = excluded.available,
+                checked = excluded.checked,
+                changed = CASE WHEN usernames.available = excluded.available
+                    THEN usernames.changed ELSE excluded.changed END,
+                changes = usernames.changes + (usernames.available != excluded.available)
+            """,
+            (service, username, int(available), now, now),
+        )
+        self.db.execute(
+            "INSERT INTO latency (service, username, checked, latency) VALUES (?, ?, ?, ?)",
+            (service, username, now, latency),
+        )
+        self.db.execute(
+            """
+            DELETE FROM latency WHERE service = ? AND username = ? AND checked NOT IN (
+                SELECT checked FROM latency WHERE service = ? AND username = ?
+                ORDER BY checked DESC LIMIT ?
+            )
+            """,
+            (service, username, service, username, self.history),
+        )
+        self.db.execute("COMMIT")
+
+        if changed and previous:
+            logger.info(
+                f"{service} username @{username} changed from {'available' if previous['available'] else 'unavailable'} to {'available' if available else 'unavailable'}"
+            )
+
+        return changed
+
+    def GetCheckpoint(self: Self, service: str, signature: str) -> int:
+        """Fetch the number of candidates of a sweep which have been checked."""
+
+        row: tuple[int] | None = self.db.execute(
+            "SELECT position FROM sweeps WHERE service = ? AND signature = ?",
+            (service, signature),
+        ).fetchone()
+
+        return row[0] if row else 0
+
+    def Checkpoint(
+        self: Self, service: str, signature: str, position: int | None
+    ) -> None:
+        """
+        Record the number of candidates of a sweep which have been checked,
+        or forget the sweep once it has completed (position is None).
+        """
+
+        if position is None:
+            self.db.execute(
+                "DELETE FROM sweeps WHERE service = ? AND signature = ?",
+                (service, signature),
+            )
+
+            return
+
+        self.db.execute(
+            """
+            INSERT INTO sweeps (service, signature, position, updated)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (service, signature) DO UPDATE SET
+                position = excluded.position,
+                updated = excluded.updated
+            """,
+            (service, signature, position, time()),
+        )
+
+    def Close(self: Self) -> None:
+        """Close the state database."""
+
+        self.db.close()
@@ -1,17 +1,48 @@
+import asyncio
 import logging
+from argparse import ArgumentParser, Namespace
+from asyncio import Queue, Semaphore, Server, Task
 from datetime import datetime, timezone
-from os import environ
+from functools import partial
+from itertools import islice
+from os import environ, path
 from sys import exit, stdout
-from typing import Self
+from time import perf_counter, time
+from typing import TYPE_CHECKING, Any, Self
 
 import dotenv
-from discord_webhook import DiscordEmbed, DiscordWebhook
-from httpx import ReadTimeout, TimeoutException
 from loguru import logger
-from loguru_discord import DiscordSink
 
-from handlers import Intercept
-from services import CashApp, GitHub, Mastodon, Snapchat, Venmo, X, YouTube
+from handlers import (
+    Breaker,
+    GetBreaker,
+    Intercept,
+    IsValid,
+    Job,
+    Normalize,
+    Outbox,
+    ParseShard,
+    Planner,
+    Prefilter,
+    QueryServer,
+    Results,
+    Scheduler,
+    Setting,
+    Shard,
+    State,
+    candidates,
+    metrics,
+    profiler,
+    results,
+)
+from services import Load, Registry
+
+if TYPE_CHECKING:
+    from cProfile import Profile
+
+    from discord_webhook import DiscordEmbed
+
+    from services import Service
 
 
 class Moniker:
@@ -24,205 +55,810 @@ class Moniker:
     def Start(self: Self) -> None:
         """Initialize Moniker and begin primary functionality."""
 
+        parser: ArgumentParser = ArgumentParser(
+            description="Monitor usernames across various services and report availability via Discord."
+        )
+
+        parser.add_argument(
+            "--daemon",
+            action="store_true",
+            help="remain resident and check usernames on a per-service interval",
+        )
+        parser.add_argument(
+            "--serve",
+            action="store_true",
+            help="remain resident and answer availability queries over HTTP",
+        )
+        parser.add_argument(
+            "--shard",
+            metavar="i/N",
+            help="check only the usernames owned by shard i of N workers which share state",
+        )
+
+        parser.add_argument(
+            "--profile",
+            nargs="?",
+            const="moniker-profile",
+            metavar="PATH",
+            help="time each phase of every request, report a per-service breakdown, and write the timings to PATH.json",
+        )
+        parser.add_argument(
+            "--cprofile",
+            action="store_true",
+            help="also profile the run with cProfile, writing its statistics to PATH.prof (implies --profile)",
+        )
+
+        args: Namespace = parser.parse_args()
+
+        if args.cprofile and not args.profile:
+            args.profile = "moniker-profile"
+
         logger.info("Moniker")
         logger.info("https://github.com/EthanC/Moniker")
 
         # Reroute standard logging to Loguru
         logging.basicConfig(handlers=[Intercept()], level=0, force=True)
 
+        # Variables set by the process environment take precedence over the
+        # environment file, including when it is reloaded (see Reload).
+        self.inherited: frozenset[str] = frozenset(environ)
+
         if dotenv.load_dotenv():
             logger.success("Loaded environment variables")
             logger.trace(environ)
 
-        if level := environ.get("LOG_LEVEL"):
+        # The shard is validated before any work begins, whether it was
+        # passed as an argument or set in the environment.
+        self.shard: tuple[int, int] | None = None
+
+        if shard := args.shard or environ.get("SHARD"):
+            try:
+                self.shard = ParseShard(shard)
+            except ValueError as e:
+                parser.error(str(e))
+
+        # Sinks may be queued so that formatting and writing log messages
+        # happens on a background thread rather than during checks.
+        enqueue: bool = Setting("LOG_ENQUEUE", False)
+        levels: list[str] = [environ.get("LOGURU_LEVEL", "DEBUG")]
+
+        if (level := environ.get("LOG_LEVEL")) or enqueue:
             logger.remove()
-            logger.add(stdout, level=level)
+            logger.add(stdout, level=level or levels[0], enqueue=enqueue)
 
-            logger.success(f"Set console logging level to {level}")
+            if level:
+                levels = [level]
+
+                logger.success(f"Set console logging level to {level}")
 
         if url := environ.get("LOG_DISCORD_WEBHOOK_URL"):
+            from httpx import ReadTimeout, TimeoutException
+            from loguru_discord import DiscordSink
+
+            # Delivery to Discord is blocking, so it is always queued.
             logger.add(
                 DiscordSink(url, suppress=[ReadTimeout, TimeoutException]),
                 level=environ.get("LOG_DISCORD_WEBHOOK_LEVEL"),
                 backtrace=False,
+                enqueue=True,
             )
 
+            levels.append(environ.get("LOG_DISCORD_WEBHOOK_LEVEL"))
+
             logger.success(f"Enabled logging to Discord webhook")
             logger.trace(url)
 
-        Moniker.CheckCashApp(self)
-        Moniker.CheckGitHub(self)
-        Moniker.CheckMastodon(self)
-        Moniker.CheckSnapchat(self)
-        Moniker.CheckVenmo(self)
-        Moniker.CheckX(self)
-        Moniker.CheckYouTube(self)
+        # Discard standard logging records which no sink would accept before
+        # they are built, as httpx and httpcore log every request.
+        logging.getLogger().setLevel(min(logger.level(name).no for name in levels))
 
-        logger.success("Completed username availability checks for all services")
+        if args.profile:
+            profiler.Enable()
 
-    def CheckCashApp(self: Self) -> None:
-        """Check availability of the configured Cash App $Cashtags."""
+        stats: Profile | None = None
 
-        if not (var := environ.get("CASHAPP_USERNAMES")):
-            logger.info("Skipping Cash App, no $Cashtags configured")
+        if args.cprofile:
+            from cProfile import Profile
 
-            return
+            stats = Profile()
+            stats.enable()
 
-        cashtags: list[str] = var.split(",")
+        try:
+            if args.daemon:
+                asyncio.run(Moniker.Daemon(self))
+            elif args.serve:
+                asyncio.run(Moniker.Serve(self))
+            else:
+                asyncio.run(Moniker.Check(self))
 
-        logger.trace(cashtags)
+                logger.success(
+                    "Completed username availability checks for all services"
+                )
+        finally:
+            if args.profile:
+                Moniker.Profile(self, args.profile, stats)
 
-        for cashtag in cashtags:
-            if not CashApp.IsUserAvailable(self, cashtag):
-                continue
+    def Profile(self: Self, file: str, stats: "Profile | None") -> None:
+        """Report and write the timings (and statistics) recorded while profiling."""
 
-            if url := environ.get("DISCORD_WEBHOOK_URL"):
-                embed: DiscordEmbed = CashApp.BuildEmbed(self, cashtag)
+        if stats:
+            stats.disable()
+            stats.dump_stats(f"{file}.prof")
 
-                Moniker.Notify(self, url, embed)
+            logger.success(
+                f"Wrote cProfile statistics to {file}.prof, view with python -m pstats {file}.prof"
+            )
 
-        logger.info("Completed $Cashtag availability checks for Cash App")
+        profiler.Report()
+        profiler.Dump(f"{file}.json")
 
-    def CheckGitHub(self: Self) -> None:
-        """Check availability of the configured GitHub usernames."""
+    async def Daemon(self: Self) -> None:
+        """
+        Remain resident and check each configured username on its service
+        interval, applying changes to the environment file without a restart.
+        """
 
-        if not (var := environ.get("GITHUB_USERNAMES")):
-            logger.info("Skipping GitHub, no usernames configured")
+        Moniker.Open(self)
 
-            return
+        scheduler: Scheduler = Scheduler()
+        server: Server | None = None
+        file: str = dotenv.find_dotenv()
+        modified: float | None = path.getmtime(file) if file else None
+        values: dict[str, str | None] = dotenv.dotenv_values(file) if file else {}
 
-        usernames: list[str] = var.split(",")
+        logger.success("Started Moniker in daemon mode")
 
-        logger.trace(usernames)
+        try:
+            if port := Setting("METRICS_PORT", 0):
+                server = await metrics.Serve(Setting("METRICS_HOST", "0.0.0.0"), port)
 
-        for username in usernames:
-            if not GitHub.IsUserAvailable(self, username):
-                continue
+            scheduler.Sync(Moniker.Jobs(self))
 
-            if url := environ.get("DISCORD_WEBHOOK_URL"):
-                embed: DiscordEmbed = GitHub.BuildEmbed(self, username)
+            while True:
+                await asyncio.sleep(Setting("DAEMON_RELOAD_INTERVAL", 5.0))
 
-                Moniker.Notify(self, url, embed)
+                if file and (mtime := path.getmtime(file)) != modified:
+                    modified = mtime
+                    values = Moniker.Reload(self, file, values)
 
-        logger.info("Completed username availability checks for GitHub")
+                    scheduler.Sync(Moniker.Jobs(self))
+        finally:
+            if server:
+                server.close()
 
-    def CheckMastodon(self: Self) -> None:
-        """Check availability of the configured Mastodon usernames."""
+            await scheduler.Stop()
+            await Moniker.Close(self)
 
-        if not (var := environ.get("MASTODON_USERNAMES")):
-            logger.info("Skipping Mastodon, no usernames configured")
+            logger.info("Stopped Moniker daemon")
 
-            return
+    async def Serve(self: Self) -> None:
+        """
+        Remain resident and answer availability queries over HTTP, sharing
+        the long-lived service clients between queries.
+        """
 
-        usernames: list[str] = var.split(",")
+        Moniker.Open(self)
 
-        logger.trace(usernames)
+        server: QueryServer = QueryServer(
+            partial(Moniker.Lookup, self),
+            lambda prefix, username: Normalize(Load(prefix), username),
+            list(Registry),
+            Setting("SERVE_CACHE_TTL", 60.0),
+            Setting("SERVE_CACHE_SIZE", 10000),
+        )
+
+        try:
+            async with await server.Serve(
+                Setting("SERVE_HOST", "127.0.0.1"), Setting("SERVE_PORT", 8080)
+            ) as listener:
+                await listener.serve_forever()
+        finally:
+            await Moniker.Close(self)
+
+            logger.info("Stopped Moniker query server")
+
+    async def Lookup(self: Self, prefix: str, username: str) -> list[dict[str, Any]]:
+        """
+        Check availability of a username on a service on demand, returning
+        a result record for each place it is checked (see Expand). Lookups
+        neither record state nor notify.
+        """
+
+        integration: type[Service] = Load(prefix)
+        username = Normalize(integration, username)
+
+        if not IsValid(integration, username):
+            return [results.Record(prefix, username, "invalid", None, None)]
+
+        service: Service = Moniker.GetService(self, integration)
+        breaker: Breaker = GetBreaker(prefix)
+
+        async def Check(username: str) -> dict[str, Any]:
+            async with self.limits[prefix], self.limit:
+                if not breaker.Allow():
+                    return results.Record(prefix, username, "skipped", None, None)
+
+                probe: bool = breaker.probing
+                detail: dict[str, Any] = results.Begin()
+                start: float = perf_counter()
+                available: bool | None = await service.IsUserAvailable(username)
+                latency: float = perf_counter() - start
+
+                if probe:
+                    breaker.Release()
+
+            return results.Record(
+                prefix,
+                username,
+                results.Outcome(available, detail),
+                detail["status"],
+                latency,
+            )
+
+        return await asyncio.gather(
+            *(Check(username) for username in integration.Expand([username]))
+        )
+
+    def Reload(
+        self: Self, file: str, previous: dict[str, str | None]
+    ) -> dict[str, str | None]:
+        """
+        Apply changes to the environment file to the running process,
+        removing variables which are no longer present. Variables set by the
+        process environment are left untouched, as they were at startup.
+        """
+
+        values: dict[str, str | None] = dotenv.dotenv_values(file)
+
+        for key in previous.keys() - values.keys() - self.inherited:
+            environ.pop(key, None)
+
+        for key, value in values.items():
+            if value is not None and key not in self.inherited:
+                environ[key] = value
+
+        logger.success(f"Reloaded environment variables from {file}")
+
+        return values
+
+    def Jobs(self: Self) -> dict[tuple[str, str], Job]:
+        """Build the set of daemon jobs for the currently configured usernames."""
 
-        for username in usernames:
-            if not Mastodon.IsUserAvailable(self, username):
+        jobs: dict[tuple[str, str], Job] = {}
+
+        for prefix in Registry:
+            if not environ.get(f"{prefix}_USERNAMES"):
                 continue
 
-            if url := environ.get("DISCORD_WEBHOOK_URL"):
-                embed: DiscordEmbed = Mastodon.BuildEmbed(self, username)
+            integration: type[Service] = Load(prefix)
 
-                Moniker.Notify(self, url, embed)
+            usernames: list[str] = Moniker.GetUsernames(self, integration)
+
+            # Replan now so that the plan reflects the reloaded usernames.
+            if Setting("ADAPTIVE_SCHEDULING", False, integration.prefix):
+                Moniker.GetPlanner(self, integration, usernames)
+
+            for username in usernames:
+                jobs[(integration.prefix, username)] = (
+                    partial(Moniker.CheckJob, self, integration, username),
+                    partial(Moniker.Interval, self, integration.prefix, username),
+                )
+
+        return jobs
+
+    def Interval(self: Self, prefix: str, username: str) -> float:
+        """
+        Fetch the check interval of a daemon job. This is resolved before
+        every sleep, so that a job which survives a reload follows the
+        current settings and plan rather than those it was created with.
+        """
+
+        # Adaptive services give each username its own interval, which is
+        # resolved from the service's plan.
+        if Setting("ADAPTIVE_SCHEDULING", False, prefix) and (
+            planner := self.planners.get(prefix)
+        ):
+            return planner.Interval(username)
+
+        return Setting("INTERVAL", 300.0, prefix)
+
+    async def CheckJob(self: Self, integration: "type[Service]", username: str) -> None:
+        """Check a single username using the daemon's long-lived service clients."""
+
+        await Moniker.CheckUsername(
+            self, Moniker.GetService(self, integration), username
+        )
+
+    def Open(self: Self) -> None:
+        """Initialize the resources shared by all checks for the lifetime of a run."""
+
+        limit: int = int(environ.get("CONCURRENCY_LIMIT", 32))
+
+        self.limit = Semaphore(limit)
+        self.limits: dict[str, Semaphore] = {}
+        self.services: dict[str, Service] = {}
+        self.planners: dict[str, Planner] = {}
+
+        logger.debug(f"Set global concurrency limit to {limit}")
+
+        self.state = State(
+            environ.get("STATE_PATH", "moniker.db"),
+            int(environ.get("STATE_LATENCY_HISTORY", 100)),
+        )
+        self.outbox = Outbox(
+            environ.get("OUTBOX_PATH", environ.get("STATE_PATH", "moniker.db"))
+        )
+
+        self.outbox.Start()
+
+        self.sink: Results | None = None
+
+        if file := environ.get("RESULTS_PATH"):
+            self.sink = Results(file)
+
+    async def Close(self: Self) -> None:
+        """Deliver pending notifications and release the resources of a run."""
+
+        for service in self.services.values():
+            await service.Close()
+
+        await self.outbox.Close()
+
+        self.state.Close()
+
+        if self.sink:
+            self.sink.Close()
+
+    def GetService(self: Self, integration: "type[Service]") -> "Service":
+        """
+        Fetch the service instance for a platform, creating it and its
+        pooled HTTP client on first use. Clients are closed by Close.
+        """
+
+        if not (service := self.services.get(integration.prefix)):
+            from handlers import BuildClient
+
+            service = integration(BuildClient(integration.prefix, integration.http2))
+
+            self.services[integration.prefix] = service
+            self.limits[integration.prefix] = Semaphore(
+                int(environ.get(f"{integration.prefix}_CONCURRENCY_LIMIT", 8))
+            )
+
+        return service
+
+    def GetPlanner(
+        self: Self, integration: "type[Service]", usernames: list[str]
+    ) -> Planner:
+        """
+        Fetch the adaptive schedule of a platform, creating it on first use
+        and replanning whenever its configured usernames change.
+        """
+
+        planner: Planner | None = self.planners.get(integration.prefix)
+
+        if not planner or planner.usernames != usernames:
+            planner = Planner(
+                self.state, Moniker.GetService(self, integration), usernames
+            )
+
+            self.planners[integration.prefix] = planner
+
+        return planner
+
+    def GetUsernames(self: Self, integration: "type[Service]") -> list[str]:
+        """Fetch the configured, valid usernames of a platform."""
 
-        logger.info("Completed username availability checks for Mastodon")
+        if not (var := environ.get(f"{integration.prefix}_USERNAMES")):
+            return []
 
-    def CheckSnapchat(self: Self) -> None:
-        """Check availability of the configured Snapchat usernames."""
+        usernames, invalid = Prefilter(integration, var.split(","))
+        usernames = integration.Expand(usernames)
 
-        if not (var := environ.get("SNAPCHAT_USERNAMES")):
-            logger.info("Skipping Snapchat, no usernames configured")
+        # When sharded, each worker checks only the usernames it owns.
+        if self.shard:
+            index, count = self.shard
+            usernames = Shard(integration.prefix, usernames, self.shard)
+            invalid = Shard(integration.prefix, invalid, self.shard)
+
+            logger.debug(
+                f"Shard {index}/{count} owns {len(usernames):,} {integration.name} {integration.label}s"
+            )
+
+        # Usernames which could never be registered are not checked, but are
+        # still recorded so that the results account for every username.
+        if self.sink:
+            for username in invalid:
+                Moniker.Export(self, integration, username, "invalid", None, None)
+
+        return usernames
+
+    async def Check(self: Self) -> None:
+        """Check availability of the configured usernames for all services concurrently."""
+
+        Moniker.Open(self)
+
+        start: float = perf_counter()
+
+        try:
+            await asyncio.gather(
+                *(Moniker.CheckService(self, prefix) for prefix in Registry),
+                *(
+                    Moniker.Sweep(self, prefix)
+                    for prefix in Registry
+                    if candidates.IsConfigured(prefix)
+                ),
+            )
+        finally:
+            await Moniker.Close(self)
+
+            duration: float = perf_counter() - start
+
+            metrics.run_duration.Set(duration)
+            metrics.run_rate.Set(sum(metrics.checks.values.values()) / duration)
+            metrics.run_completed.Set(time())
+
+            if file := environ.get("METRICS_TEXTFILE"):
+                metrics.WriteTextfile(file)
+
+    async def CheckService(self: Self, prefix: str) -> None:
+        """
+        Concurrently check availability of the configured usernames for a
+        service, bounded by both the global and per-service concurrency limits.
+        """
+
+        # The service is only imported once it is known to be configured.
+        if not environ.get(f"{prefix}_USERNAMES"):
+            if not candidates.IsConfigured(prefix):
+                _, _, name, label = Registry[prefix]
+
+                logger.info(f"Skipping {name}, no {label}s configured")
 
             return
 
-        usernames: list[str] = var.split(",")
+        integration: type[Service] = Load(prefix)
+
+        if not (usernames := Moniker.GetUsernames(self, integration)):
+            logger.info(
+                f"Skipping {integration.name}, no valid {integration.label}s configured"
+            )
+
+            return
 
         logger.trace(usernames)
 
-        for username in usernames:
-            if not Snapchat.IsUserAvailable(self, username):
-                continue
+        service: Service = Moniker.GetService(self, integration)
+
+        # Adaptive services only check the usernames whose own interval has
+        # elapsed since they were last checked.
+        if Setting("ADAPTIVE_SCHEDULING", False, prefix):
+            planner: Planner = Moniker.GetPlanner(self, integration, usernames)
+            due: list[str] = [
+                username for username in usernames if planner.IsDue(username)
+            ]
+
+            if deferred := len(usernames) - len(due):
+                logger.info(
+                    f"Deferring {deferred:,} {integration.name} {integration.label}s until they are due"
+                )
+
+            if not (usernames := due):
+                return
+
+        # Services which support bulk lookups resolve many usernames per
+        # request rather than one request per username.
+        if size := service.batch:
+            await asyncio.gather(
+                *(
+                    Moniker.CheckBatch(self, service, usernames[i : i + size])
+                    for i in range(0, len(usernames), size)
+                )
+            )
+        else:
+            await asyncio.gather(
+                *(
+                    Moniker.CheckUsername(self, service, username)
+                    for username in usernames
+                )
+            )
 
-            if url := environ.get("DISCORD_WEBHOOK_URL"):
-                embed: DiscordEmbed = Snapchat.BuildEmbed(self, username)
+        logger.info(
+            f"Completed {integration.label} availability checks for {integration.name}"
+        )
 
-                Moniker.Notify(self, url, embed)
+    async def Sweep(self: Self, prefix: str) -> None:
+        """
+        Check every candidate generated by a service's sweep. Candidates are
+        generated only as workers become free, so that memory use is constant
+        regardless of the size of the sweep, and progress is checkpointed so
+        that an interrupted sweep resumes where it left off.
+        """
+
+        integration: type[Service] = Load(prefix)
+        service: Service = Moniker.GetService(self, integration)
+        name: str = type(service).__name__
+
+        # A misconfigured sweep (e.g. a missing wordlist) must not abort the
+        # checks of other services which run alongside it.
+        try:
+            sweep, signature = candidates.Candidates(prefix)
+        except (OSError, ValueError) as e:
+            logger.error(f"Skipping {integration.name} sweep, {e}")
+
+            return
+
+        position: int = self.state.GetCheckpoint(name, signature)
+        interval: int = max(Setting("SWEEP_CHECKPOINT", 1000, prefix), 1)
+        workers: int = int(environ.get(f"{prefix}_CONCURRENCY_LIMIT", 8))
+        size: int = service.batch or 1
+
+        # Each chunk of candidates is identified by the position of its first
+        # candidate. The checkpoint is the first chunk which is incomplete.
+        queue: Queue[tuple[int, list[str]] | None] = Queue(maxsize=workers)
+        pending: set[int] = set()
+        invalid: int = 0
+
+        if position:
+            logger.info(
+                f"Resuming {integration.name} sweep after {position:,} candidates"
+            )
+
+        async def Work() -> None:
+            while (chunk := await queue.get()) is not None:
+                start, usernames = chunk
+
+                if service.batch:
+                    await Moniker.CheckBatch(self, service, usernames)
+                else:
+                    await asyncio.gather(
+                        *(
+                            Moniker.CheckUsername(self, service, username)
+                            for username in usernames
+                        )
+                    )
+
+                pending.discard(start)
+
+        tasks: list[Task] = [asyncio.create_task(Work()) for _ in range(workers)]
+        start: int = position
+        chunk: list[str] = []
+        complete: bool = False
+
+        try:
+            for index, candidate in enumerate(islice(sweep, position, None), position):
+                usernames: list[str] = Moniker.Candidate(self, integration, candidate)
+
+                if not usernames:
+                    invalid += 1
+
+                chunk.extend(usernames)
+
+                if len(chunk) >= size:
+                    pending.add(start)
+
+                    await queue.put((start, chunk))
 
-        logger.info("Completed username availability checks for Snapchat")
+                    start, chunk = index + 1, []
 
-    def CheckX(self: Self) -> None:
-        """Check availability of the configured X usernames."""
+                if (index + 1) % interval == 0:
+                    self.state.Checkpoint(name, signature, min(pending, default=start))
 
-        if not (var := environ.get("X_USERNAMES")):
-            logger.info("Skipping X, no usernames configured")
+                    logger.debug(
+                        "Swept {:,} {} candidates", index + 1, integration.name
+                    )
 
+            if chunk:
+                pending.add(start)
+
+                await queue.put((start, chunk))
+
+            for _ in tasks:
+                await queue.put(None)
+
+            await asyncio.gather(*tasks)
+
+            complete = True
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            self.state.Checkpoint(
+                name, signature, None if complete else min(pending, default=start)
+            )
+
+        logger.info(
+            f"Completed {integration.name} sweep, skipped {invalid:,} invalid or unowned candidates"
+        )
+
+    def Candidate(
+        self: Self, integration: "type[Service]", candidate: str
+    ) -> list[str]:
+        """
+        Prepare a sweep candidate as configured usernames are prepared (see
+        GetUsernames), returning the usernames to check, if any.
+        """
+
+        username: str = Normalize(integration, candidate)
+
+        if not username or not IsValid(integration, username):
+            return []
+
+        usernames: list[str] = integration.Expand([username])
+
+        if self.shard:
+            usernames = Shard(integration.prefix, usernames, self.shard)
+
+        return usernames
+
+    async def CheckUsername(self: Self, service: "Service", username: str) -> None:
+        """
+        Check availability of a single username and notify if it has become
+        available since it was last checked.
+        """
+
+        if Moniker.IsFresh(self, service, username):
             return
 
-        usernames: list[str] = var.split(",")
+        breaker: Breaker = GetBreaker(service.prefix)
 
-        logger.trace(usernames)
+        async with self.limits[service.prefix], self.limit:
+            # Checks queued behind a failing service are skipped once its
+            # circuit opens, rather than each waiting for a timeout.
+            if not breaker.Allow():
+                Moniker.Skip(self, service, [username])
 
-        for username in usernames:
-            if not X.IsUserAvailable(self, username):
-                continue
+                return
 
-            if url := environ.get("DISCORD_WEBHOOK_URL"):
-                embed: DiscordEmbed = X.BuildEmbed(self, username)
+            # Only one check is allowed through as a probe while the circuit
+            # is open, which is released should it make no request.
+            probe: bool = breaker.probing
+            detail: dict[str, Any] = results.Begin()
+            start: float = perf_counter()
+            available: bool | None = await service.IsUserAvailable(username)
+            latency: float = perf_counter() - start
 
-                Moniker.Notify(self, url, embed)
+            if probe:
+                breaker.Release()
 
-        logger.info("Completed username availability checks for X")
+        Moniker.Report(self, service, username, available, latency, detail)
 
-    def CheckVenmo(self: Self) -> None:
-        """Check availability of the configured Venmo usernames."""
+    async def CheckBatch(self: Self, service: "Service", usernames: list[str]) -> None:
+        """
+        Check availability of a batch of usernames using a single bulk
+        lookup and notify for those which have become available.
+        """
 
-        if not (var := environ.get("VENMO_USERNAMES")):
-            logger.info("Skipping Venmo, no usernames configured")
+        usernames = [
+            username
+            for username in usernames
+            if not Moniker.IsFresh(self, service, username)
+        ]
 
+        if not usernames:
             return
 
-        usernames: list[str] = var.split(",")
+        breaker: Breaker = GetBreaker(service.prefix)
 
-        logger.trace(usernames)
+        async with self.limits[service.prefix], self.limit:
+            if not breaker.Allow():
+                Moniker.Skip(self, service, usernames)
 
-        for username in usernames:
-            if not Venmo.IsUserAvailable(self, username):
-                continue
+                return
 
-            if url := environ.get("DISCORD_WEBHOOK_URL"):
-                embed: DiscordEmbed = Venmo.BuildEmbed(self, username)
+            probe: bool = breaker.probing
+            detail: dict[str, Any] = results.Begin()
+            start: float = perf_counter()
+            verdicts: dict[str, bool | None] = await service.AreUsersAvailable(
+                usernames
+            )
+            latency: float = perf_counter() - start
 
-                Moniker.Notify(self, url, embed)
+            if probe:
+                breaker.Release()
+
+        for username, available in verdicts.items():
+            Moniker.Report(self, service, username, available, latency, detail)
+
+    def Skip(self: Self, service: "Service", usernames: list[str]) -> None:
+        """Leave usernames unchecked because the service's circuit is open."""
 
-        logger.info("Completed username availability checks for Venmo")
+        metrics.checks.Inc(len(usernames), service=service.prefix, result="skipped")
 
-    def CheckYouTube(self: Self) -> None:
-        """Check availability of the configured YouTube usernames."""
+        if self.sink:
+            for username in usernames:
+                Moniker.Export(self, service, username, "skipped", None, None)
 
-        if not (var := environ.get("YOUTUBE_USERNAMES")):
-            logger.info("Skipping YouTube, no usernames configured")
+        logger.debug(
+            "Skipping {:,} {} {}s, circuit is open",
+            len(usernames),
+            service.name,
+            service.label,
+        )
+
+    def IsFresh(self: Self, service: "Service", username: str) -> bool:
+        """Determine if a username was checked recently enough to be skipped."""
+
+        name: str = type(service).__name__
+        window: float = Setting("STATE_FRESHNESS", 0.0, service.prefix)
+
+        if self.state.IsFresh(name, username, window):
+            logger.debug(
+                "Skipping {} {} {}{}, checked recently",
+                service.name,
+                service.label,
+                service.sigil,
+                username,
+            )
+
+            return True
+
+        return False
+
+    def Report(
+        self: Self,
+        service: "Service",
+        username: str,
+        available: bool | None,
+        latency: float,
+        detail: dict[str, Any],
+    ) -> None:
+        """Record the result of a check and notify if the username became available."""
+
+        if self.sink:
+            Moniker.Export(
+                self,
+                service,
+                username,
+                results.Outcome(available, detail),
+                detail["status"],
+                latency,
+            )
+
+        # Availability could not be determined, so the username is left as
+        # it was last recorded rather than treated as unavailable.
+        if available is None:
+            metrics.checks.Inc(service=service.prefix, result="unchecked")
 
             return
 
-        usernames: list[str] = var.split(",")
+        changed: bool = self.state.Record(
+            type(service).__name__, username, available, latency
+        )
 
-        logger.trace(usernames)
+        metrics.checks.Inc(
+            service=service.prefix, result="available" if available else "unavailable"
+        )
+        metrics.check_duration.Observe(latency, service=service.prefix)
 
-        for username in usernames:
-            if not YouTube.IsUserAvailable(self, username):
-                continue
+        if not (changed and available):
+            return
 
-            if url := environ.get("DISCORD_WEBHOOK_URL"):
-                embed: DiscordEmbed = YouTube.BuildEmbed(self, username)
+        if url := environ.get("DISCORD_WEBHOOK_URL"):
+            with profiler.Measure(service.prefix, "embed"):
+                embed: DiscordEmbed = service.BuildEmbed(username)
 
+            with profiler.Measure(service.prefix, "notify"):
                 Moniker.Notify(self, url, embed)
 
-        logger.info("Completed username availability checks for YouTube")
+    def Export(
+        self: Self,
+        service: "Service | type[Service]",
+        username: str,
+        outcome: str,
+        status: int | None,
+        latency: float | None,
+    ) -> None:
+        """Stream the record of a check to the results file."""
+
+        self.sink.Write(
+            results.Record(service.prefix, username, outcome, status, latency)
+        )
 
-    def Notify(self: Self, url: str, embed: DiscordEmbed) -> None:
-        """Report username availability to the configured Discord webhook."""
+    def Notify(self: Self, url: str, embed: "DiscordEmbed") -> None:
+        """
+        Queue a username availability report for delivery to the configured
+        Discord webhook.
+        """
 
         embed.set_author(
             "Moniker",
@@ -231,7 +867,7 @@ class Moniker:
         )
         embed.set_timestamp(datetime.now(timezone.utc).timestamp())
 
-        DiscordWebhook(url=url, embeds=[embed], rate_limit_retry=True).execute()
+        self.outbox.Put(url, embed)
 
 
 if __name__ == "__main__":
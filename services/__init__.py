@@ -1,8 +1,49 @@
-# ruff: noqa: F401
-from .cashapp import CashApp
-from .github import GitHub
-from .mastodon import Mastodon
-from .snapchat import Snapchat
-from .venmo import Venmo
-from .x import X
-from .youtube import YouTube
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cashapp import CashApp
+    from .github import GitHub
+    from .mastodon import Mastodon
+    from .service import Service
+    from .snapchat import Snapchat
+    from .venmo import Venmo
+    from .x import X
+    from .youtube import YouTube
+
+# Registry of every supported platform, keyed by the prefix of its
+# environment variables. Each platform is checked by the same pipeline, so
+# adding a platform only requires its declaration and an entry here.
+# Platforms are imported only when they are configured, so each entry also
+# carries the platform's display name and username label (which must match
+# its declaration) for messages about platforms which are not configured.
+Registry: dict[str, tuple[str, str, str, str]] = {
+    "CASHAPP": (".cashapp", "CashApp", "Cash App", "$Cashtag"),
+    "GITHUB": (".github", "GitHub", "GitHub", "username"),
+    "MASTODON": (".mastodon", "Mastodon", "Mastodon", "username"),
+    "SNAPCHAT": (".snapchat", "Snapchat", "Snapchat", "username"),
+    "VENMO": (".venmo", "Venmo", "Venmo", "username"),
+    "X": (".x", "X", "X", "username"),
+    "YOUTUBE": (".youtube", "YouTube", "YouTube", "username"),
+}
+
+
+def Load(prefix: str) -> type["Service"]:
+    """Import the platform registered under the provided prefix."""
+
+    module, name, _, _ = Registry[prefix]
+
+    return getattr(import_module(module, __name__), name)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a platform (or the Service base class) on first access."""
+
+    if name == "Service":
+        return import_module(".service", __name__).Service
+
+    for module, attribute, _, _ in Registry.values():
+        if attribute == name:
+            return getattr(import_module(module, __name__), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,57 +1,30 @@
-from typing import Self
+import re
+from re import Pattern
+from typing import ClassVar
 
-import httpx
-from discord_webhook import DiscordEmbed
-from httpx import Response
-from loguru import logger
+from .service import Service
 
 
-class CashApp:
+class CashApp(Service):
     """
     Class to integrate with Cash App and build objects specific to the
     Cash App platform.
     """
 
-    def IsUserAvailable(self: Self, cashtag: str) -> bool:
-        """Determine if a Cash App $Cashtag is available."""
+    name: ClassVar[str] = "Cash App"
+    prefix: ClassVar[str] = "CASHAPP"
+    label: ClassVar[str] = "$Cashtag"
+    sigil: ClassVar[str] = "$"
 
-        status: int | None = None
+    # Cash App returns HTTP 404 (Not Found) for non-existent accounts,
+    # and HTTP 200 (Success) for existing accounts.
+    url: ClassVar[str] = "https://cash.app/${username}"
+    profile: ClassVar[str] = "https://cash.app/${username}"
+    follow_redirects: ClassVar[bool] = True
 
-        try:
-            res: Response = httpx.get(
-                f"https://cash.app/${cashtag}", follow_redirects=True
-            )
-            status = res.status_code
+    # $Cashtags are 1-20 characters, contain at least one letter, and
+    # are case-insensitive.
+    pattern: ClassVar[Pattern] = re.compile(r"(?=.*[a-z])[a-z0-9_-]{1,20}")
 
-            logger.trace(f"HTTP {status} GET {res.url}: {res.text}")
-        except Exception as e:
-            logger.opt(exception=e).error(
-                f"Failed to determine availability of Cash App $Cashtag ${cashtag}"
-            )
-
-        # Cash App returns HTTP 404 (Not Found) for non-existent accounts,
-        # and HTTP 200 (Success) for existing accounts.
-        if status:
-            if status == 404:
-                logger.success(f"Cash App $Cashtag ${cashtag} is available")
-
-                return True
-            elif status == 200:
-                logger.info(
-                    f"Fetched Cash App user ${cashtag}, $Cashtag is unavailable"
-                )
-
-        return False
-
-    def BuildEmbed(self: Self, cashtag: str) -> DiscordEmbed:
-        """Build a Discord embed object for an available Cash App $Cashtag."""
-
-        embed: DiscordEmbed = DiscordEmbed()
-
-        embed.set_description(
-            f"Cash App $Cashtag [${cashtag}](https://cash.app/${cashtag}) is currently available."
-        )
-        embed.set_color("00C244")
-        embed.set_footer(text="Cash App", icon_url="https://i.imgur.com/Mbr5HTD.png")
-
-        return embed
+    color: ClassVar[str] = "00C244"
+    icon: ClassVar[str] = "https://i.imgur.com/Mbr5HTD.png"
@@ -1,53 +1,153 @@
-from typing import Self
+import json
+import re
+from os import environ
+from re import Pattern
+from typing import TYPE_CHECKING, Any, ClassVar, Self
 
-import httpx
-from discord_webhook import DiscordEmbed
-from httpx import Response
 from loguru import logger
 
+from handlers import Setting, results
 
-class GitHub:
+from .service import Service
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient, Response
+
+
+class GitHub(Service):
     """
     Class to integrate with GitHub and build objects specific to the
     GitHub platform.
     """
 
-    def IsUserAvailable(self: Self, username: str) -> bool:
+    name: ClassVar[str] = "GitHub"
+    prefix: ClassVar[str] = "GITHUB"
+
+    # GitHub returns HTTP 404 (Not Found) for non-existent accounts,
+    # and HTTP 200 (Success) for existing accounts.
+    url: ClassVar[str] = "https://github.com/{username}"
+    profile: ClassVar[str] = "https://github.com/{username}"
+    probe: ClassVar[str] = "HEAD"
+
+    # Usernames are 1-39 alphanumeric characters or single hyphens, which
+    # cannot begin or end the username, and are case-insensitive.
+    pattern: ClassVar[Pattern] = re.compile(r"(?=.{1,39}$)[a-z0-9](?:-?[a-z0-9])*")
+    reserved: ClassVar[frozenset[str]] = frozenset(
+        {
+            "about",
+            "api",
+            "apps",
+            "dashboard",
+            "enterprise",
+            "explore",
+            "features",
+            "issues",
+            "join",
+            "login",
+            "logout",
+            "marketplace",
+            "new",
+            "notifications",
+            "organizations",
+            "orgs",
+            "pricing",
+            "pulls",
+            "security",
+            "settings",
+            "site",
+            "sponsors",
+            "topics",
+            "trending",
+        }
+    )
+
+    http2: ClassVar[bool] = True
+
+    color: ClassVar[str] = "171515"
+    icon: ClassVar[str] = "https://i.imgur.com/C3M0uwh.png"
+
+    def __init__(self: Self, client: "AsyncClient") -> None:
+        """Bind the service to a long-lived, pooled HTTP client."""
+
+        super().__init__(client)
+
+        self.token: str | None = environ.get("GITHUB_TOKEN")
+
+        # Bulk lookups require authentication with the GraphQL API, without
+        # a token the public profile of each username is checked instead.
+        self.batch = Setting("BATCH_SIZE", 100, self.prefix) if self.token else 0
+
+    async def IsUserAvailable(self: Self, username: str) -> bool | None:
         """Determine if a GitHub username is available."""
 
-        status: int | None = None
+        if self.token:
+            return (await self.AreUsersAvailable([username]))[username]
+
+        return await super().IsUserAvailable(username)
+
+    async def AreUsersAvailable(
+        self: Self, usernames: list[str]
+    ) -> dict[str, bool | None]:
+        """
+        Determine if each of the provided GitHub usernames is available using
+        a single GraphQL request with an aliased field per username.
+        """
+
+        if not self.token:
+            return await super().AreUsersAvailable(usernames)
+
+        # repositoryOwner is used rather than user so that usernames held
+        # by organizations are also reported as unavailable.
+        query: str = " ".join(
+            f"u{i}: repositoryOwner(login: {json.dumps(username)}) {{ login }}"
+            for i, username in enumerate(usernames)
+        )
+        data: dict[str, Any] = {}
 
         try:
-            res: Response = httpx.get(f"https://github.com/{username}")
-            status = res.status_code
+            res: Response = await self.client.post(
+                "https://api.github.com/graphql",
+                json={"query": f"query {{ {query} }}"},
+                headers={"Authorization": f"Bearer {self.token}"},
+            )
+
+            results.Note(status=res.status_code)
+
+            res.raise_for_status()
+
+            body: dict[str, Any] = res.json()
 
-            logger.trace(f"HTTP {status} GET {res.url}: {res.text}")
+            # GraphQL returns a NOT_FOUND error alongside a null value for
+            # each non-existent account, any other error is a failure.
+            if errors := [
+                error
+                for error in body.get("errors", [])
+                if error.get("type") != "NOT_FOUND"
+            ]:
+                raise ValueError(errors)
+
+            data = body["data"]
+
+            logger.trace("HTTP {} POST {}: {}", res.status_code, res.url, data)
         except Exception as e:
+            results.Note(outcome="error")
+
             logger.opt(exception=e).error(
-                f"Failed to determine availability of GitHub username @{username}"
+                f"Failed to determine availability of {len(usernames):,} GitHub usernames"
             )
 
-        # GitHub returns HTTP 404 (Not Found) for non-existent accounts,
-        # and HTTP 200 (Success) for existing accounts.
-        if status:
-            if status == 404:
-                logger.success(f"GitHub username @{username} is available")
+            return {username: None for username in usernames}
 
-                return True
-            elif status == 200:
-                logger.info(f"Fetched GitHub user @{username}, username is unavailable")
+        verdicts: dict[str, bool | None] = {}
 
-        return False
+        for i, username in enumerate(usernames):
+            verdicts[username] = data.get(f"u{i}") is None
 
-    def BuildEmbed(self: Self, username: str) -> DiscordEmbed:
-        """Build a Discord embed object for an available GitHub username."""
-
-        embed: DiscordEmbed = DiscordEmbed()
-
-        embed.set_description(
-            f"GitHub username [@{username}](https://github.com/{username}) is currently available."
-        )
-        embed.set_color("171515")
-        embed.set_footer(text="GitHub", icon_url="https://i.imgur.com/C3M0uwh.png")
+            if verdicts[username]:
+                logger.success("GitHub username @{} is available", username)
+            else:
+                logger.info(
+                    "Fetched GitHub user @{}, username is unavailable", username
+                )
 
-        return embed
+        return verdicts
@@ -1,57 +1,138 @@
-from typing import Self
+import re
+from os import environ
+from re import Pattern
+from time import monotonic
+from typing import TYPE_CHECKING, ClassVar, Self
 
-import httpx
-from discord_webhook import DiscordEmbed
-from httpx import Response
 from loguru import logger
 
+from handlers import BuildClient, Setting, results
 
-class Mastodon:
+from .service import Service
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+
+
+class Mastodon(Service):
     """
     Class to integrate with Mastodon and build objects specific to the
     Mastodon platform.
     """
 
-    def IsUserAvailable(self: Self, username: str) -> bool:
-        """Determine if a Mastodon username is available."""
+    name: ClassVar[str] = "Mastodon"
+    prefix: ClassVar[str] = "MASTODON"
+
+    # Mastodon returns HTTP 404 (Not Found) for non-existent accounts,
+    # and HTTP 200 (Success) for existing accounts.
+    url: ClassVar[str] = "https://{instance}/api/v1/accounts/lookup?acct={username}"
+    profile: ClassVar[str] = "https://{instance}/@{username}"
+
+    # Usernames are 1-30 letters, numbers, or underscores, and are
+    # case-insensitive.
+    pattern: ClassVar[Pattern] = re.compile(r"[a-z0-9_]{1,30}")
+    reserved: ClassVar[frozenset[str]] = frozenset(
+        {"admin", "administrator", "root", "support", "help", "mastodon"}
+    )
+
+    http2: ClassVar[bool] = True
+
+    color: ClassVar[str] = "6364FF"
+    icon: ClassVar[str] = "https://i.imgur.com/Xh51yxT.png"
 
-        status: int | None = None
+    def __init__(self: Self, client: "AsyncClient") -> None:
+        """Bind the service to a long-lived, pooled HTTP client per instance."""
 
-        try:
-            res: Response = httpx.get(
-                f"https://mastodon.social/api/v1/accounts/lookup?acct={username}"
+        super().__init__(client)
+
+        self.clients: dict[str, AsyncClient] = {}
+
+        # Instances which failed a check (e.g. timed out) are skipped until
+        # the time (per time.monotonic) recorded here.
+        self.unhealthy: dict[str, float] = {}
+
+    @classmethod
+    def Expand(cls: type[Self], usernames: list[str]) -> list[str]:
+        """Check each username on every configured instance, as user@instance."""
+
+        instances: list[str] = [
+            instance.strip().lower()
+            for instance in environ.get("MASTODON_INSTANCES", "mastodon.social").split(
+                ","
             )
-            status = res.status_code
+            if instance.strip()
+        ]
+
+        return [
+            f"{username}@{instance}" for username in usernames for instance in instances
+        ]
+
+    def Format(self: Self, template: str, username: str) -> str:
+        """Format a URL template for a username on its instance."""
+
+        username, _, instance = username.partition("@")
 
-            logger.trace(f"HTTP {status} GET {res.url}: {res.text}")
-        except Exception as e:
-            logger.opt(exception=e).error(
-                f"Failed to determine availability of Mastodon username @{username}"
+        return template.format(username=username, instance=instance)
+
+    def GetClient(self: Self, username: str) -> "AsyncClient":
+        """
+        Fetch the HTTP client of the username's instance, so that each
+        instance has its own connection pool. Instance clients do not report
+        to the Mastodon circuit breaker, as one dead instance would otherwise
+        open it for every instance. Failing instances are instead skipped by
+        IsUserAvailable.
+        """
+
+        instance: str = username.partition("@")[2]
+
+        if not (client := self.clients.get(instance)):
+            client = self.clients[instance] = BuildClient(
+                self.prefix, self.http2, circuit=False
             )
 
-        # Mastodon returns HTTP 404 (Not Found) for non-existent accounts,
-        # and HTTP 200 (Success) for existing accounts.
-        if status:
-            if status == 404:
-                logger.success(f"Mastodon username @{username} is available")
+        return client
 
-                return True
-            elif status == 200:
-                logger.info(
-                    f"Fetched Mastodon user @{username}, username is unavailable"
-                )
+    async def Close(self: Self) -> None:
+        """Close the HTTP clients of every instance."""
+
+        await super().Close()
+
+        for client in self.clients.values():
+            await client.aclose()
+
+    async def IsUserAvailable(self: Self, username: str) -> bool | None:
+        """
+        Determine if a Mastodon username is available on its instance,
+        skipping instances which recently failed to respond, or responded
+        with a server error. A slow instance fails once its requests exceed
+        MASTODON_HTTP_TIMEOUT.
+        """
 
-        return False
+        instance: str = username.partition("@")[2]
 
-    def BuildEmbed(self: Self, username: str) -> DiscordEmbed:
-        """Build a Discord embed object for an available Mastodon username."""
+        if self.unhealthy.get(instance, 0.0) > monotonic():
+            results.Note(outcome="skipped")
 
-        embed: DiscordEmbed = DiscordEmbed()
+            logger.debug(
+                "Skipping Mastodon username @{}, instance is unhealthy", username
+            )
+
+            return None
+
+        available: bool | None = await super().IsUserAvailable(username)
+        status: int | None = (results.current.get() or {}).get("status")
+
+        # An unexpected status which the instance did respond with concerns
+        # only that account (e.g. HTTP 410 for a suspended account), whereas
+        # no response or an HTTP 5xx means the instance itself is failing.
+        if available is None and (not status or status >= 500):
+            cooldown: float = Setting("INSTANCE_COOLDOWN", 300.0, self.prefix)
+
+            if self.unhealthy.get(instance, 0.0) <= monotonic():
+                logger.warning(
+                    f"Mastodon instance {instance} is down or slow, skipping it for {cooldown:,.0f}s"
+                )
 
-        embed.set_description(
-            f"Mastodon username [@{username}](https://mastodon.social/@{username}) is currently available."
-        )
-        embed.set_color("6364FF")
-        embed.set_footer(text="Mastodon", icon_url="https://i.imgur.com/Xh51yxT.png")
+            self.unhealthy[instance] = monotonic() + cooldown
 
-        return embed
+        return available
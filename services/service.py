@@ -0,0 +1,179 @@
+from re import Pattern
+from typing import TYPE_CHECKING, ClassVar, Self
+
+from loguru import logger
+
+from handlers import Probe, results
+
+if TYPE_CHECKING:
+    from discord_webhook import DiscordEmbed
+    from httpx import AsyncClient, Response
+
+
+class Service:
+    """
+    Base class for a platform on which username availability is monitored.
+
+    Platforms are declared by subclassing Service and setting the class
+    attributes below. Availability is determined by probing the URL
+    template and mapping the HTTP status, which suits most platforms.
+    Platforms which require more (e.g. parsing the response) override
+    IsUserAvailable.
+
+    Availability is reported as True (available), False (unavailable), or
+    None when it could not be determined, in which case the username is
+    treated as not checked rather than as unavailable. Details of a check,
+    such as its HTTP status, are recorded for its result using results.Note.
+    """
+
+    # Display name of the platform.
+    name: ClassVar[str]
+
+    # Prefix of the platform's environment variables, such as
+    # GITHUB_USERNAMES and GITHUB_HTTP_TIMEOUT.
+    prefix: ClassVar[str]
+
+    # Term and symbol the platform uses for a username.
+    label: ClassVar[str] = "username"
+    sigil: ClassVar[str] = "@"
+
+    # URL template used to determine availability, and URL template of the
+    # public profile linked in notifications.
+    url: ClassVar[str]
+    profile: ClassVar[str]
+
+    # Request method used to probe the URL. HEAD is used where the host
+    # honors it, otherwise GET is streamed without reading the body.
+    probe: ClassVar[str] = "GET"
+    follow_redirects: ClassVar[bool] = False
+
+    # HTTP statuses which indicate a username is available or unavailable.
+    # Any other status is treated as a failure.
+    available: ClassVar[tuple[int, ...]] = (404,)
+    unavailable: ClassVar[tuple[int, ...]] = (200,)
+
+    # Validation rules applied before any request is made. The pattern must
+    # match the entire username, reserved names can never be registered.
+    pattern: ClassVar[Pattern | None] = None
+    reserved: ClassVar[frozenset[str]] = frozenset()
+    insensitive: ClassVar[bool] = True
+
+    # Whether the host is known to support HTTP/2 negotiation.
+    http2: ClassVar[bool] = False
+
+    # Maximum number of usernames resolved per bulk lookup, zero if the
+    # platform does not support bulk lookups (see AreUsersAvailable).
+    batch: int = 0
+
+    # Embed color and footer icon used in notifications.
+    color: ClassVar[str]
+    icon: ClassVar[str]
+
+    def __init__(self: Self, client: "AsyncClient") -> None:
+        """Bind the service to a long-lived, pooled HTTP client."""
+
+        self.client: AsyncClient = client
+
+    @classmethod
+    def Expand(cls: type[Self], usernames: list[str]) -> list[str]:
+        """
+        Expand the configured usernames into those which are checked. Platforms
+        on which a username exists in several places (e.g. instances) override
+        this to check each of them separately.
+        """
+
+        return usernames
+
+    def Format(self: Self, template: str, username: str) -> str:
+        """Format a URL template (such as url or profile) for a username."""
+
+        return template.format(username=username)
+
+    def GetClient(self: Self, username: str) -> "AsyncClient":
+        """Fetch the HTTP client used to check a username."""
+
+        return self.client
+
+    async def Close(self: Self) -> None:
+        """Close the HTTP clients of the service."""
+
+        await self.client.aclose()
+
+    async def IsUserAvailable(self: Self, username: str) -> bool | None:
+        """Determine if a username is available."""
+
+        status: int | None = None
+
+        try:
+            res: Response = await Probe(
+                self.GetClient(username),
+                self.Format(self.url, username),
+                self.probe,
+                follow_redirects=self.follow_redirects,
+            )
+            status = res.status_code
+
+            results.Note(status=status)
+        except Exception as e:
+            logger.opt(exception=e).error(
+                f"Failed to determine availability of {self.name} {self.label} {self.sigil}{username}"
+            )
+
+        if not status:
+            return None
+
+        if status in self.available:
+            logger.success(
+                "{} {} {}{} is available", self.name, self.label, self.sigil, username
+            )
+
+            return True
+
+        if status in self.unavailable:
+            logger.info(
+                "Fetched {} user {}{}, {} is unavailable",
+                self.name,
+                self.sigil,
+                username,
+                self.label,
+            )
+
+            return False
+
+        logger.warning(
+            "Unexpected HTTP {} for {} {} {}{}",
+            status,
+            self.name,
+            self.label,
+            self.sigil,
+            username,
+        )
+
+        return None
+
+    async def AreUsersAvailable(
+        self: Self, usernames: list[str]
+    ) -> dict[str, bool | None]:
+        """
+        Determine if each of the provided usernames is available. Platforms
+        which support bulk lookups override this and set batch.
+        """
+
+        return {
+            username: await self.IsUserAvailable(username) for username in usernames
+        }
+
+    def BuildEmbed(self: Self, username: str) -> "DiscordEmbed":
+        """Build a Discord embed object for an available username."""
+
+        from discord_webhook import DiscordEmbed
+
+        embed: DiscordEmbed = DiscordEmbed()
+
+        embed.set_description(
+            f"{self.name} {self.label} [{self.sigil}{username}]({self.Format(self.profile, username)}) is currently available."
+        )
+        embed.set_color(self.color)
+        embed.set_footer(text=self.name, icon_url=self.icon)
+
+        return embed
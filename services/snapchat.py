@@ -1,57 +1,29 @@
-from typing import Self
+import re
+from re import Pattern
+from typing import ClassVar
 
-import httpx
-from discord_webhook import DiscordEmbed
-from httpx import Response
-from loguru import logger
+from .service import Service
 
 
-class Snapchat:
+class Snapchat(Service):
     """
     Class to integrate with Snapchat and build objects specific to the
     Snapchat platform.
     """
 
-    def IsUserAvailable(self: Self, username: str) -> bool:
-        """Determine if a Snapchat username is available."""
+    name: ClassVar[str] = "Snapchat"
+    prefix: ClassVar[str] = "SNAPCHAT"
 
-        status: int | None = None
+    # Snapchat returns HTTP 404 (Not Found) for non-existent accounts,
+    # and HTTP 200 (Success) for existing accounts.
+    url: ClassVar[str] = "https://www.snapchat.com/add/{username}"
+    profile: ClassVar[str] = "https://snapchat.com/add/{username}"
+    follow_redirects: ClassVar[bool] = True
 
-        try:
-            res: Response = httpx.get(
-                f"https://www.snapchat.com/add/{username}", follow_redirects=True
-            )
-            status = res.status_code
+    # Usernames are 3-15 characters which begin with a letter, end with a
+    # letter or number, and contain only letters, numbers, hyphens,
+    # underscores, or periods. Usernames are case-insensitive.
+    pattern: ClassVar[Pattern] = re.compile(r"[a-z][a-z0-9._-]{1,13}[a-z0-9]")
 
-            logger.trace(f"HTTP {status} GET {res.url}: {res.text}")
-        except Exception as e:
-            logger.opt(exception=e).error(
-                f"Failed to determine availability of Snapchat username @{username}"
-            )
-
-        # Snapchat returns HTTP 404 (Not Found) for non-existent accounts,
-        # and HTTP 200 (Success) for existing accounts.
-        if status:
-            if status == 404:
-                logger.success(f"Snapchat username @{username} is available")
-
-                return True
-            elif status == 200:
-                logger.info(
-                    f"Fetched Snapchat user @{username}, username is unavailable"
-                )
-
-        return False
-
-    def BuildEmbed(self: Self, username: str) -> DiscordEmbed:
-        """Build a Discord embed object for an available Snapchat username."""
-
-        embed: DiscordEmbed = DiscordEmbed()
-
-        embed.set_description(
-            f"Snapchat username [@{username}](https://snapchat.com/add/{username}) is currently available."
-        )
-        embed.set_color("FFFC00")
-        embed.set_footer(text="Snapchat", icon_url="https://i.imgur.com/NARmOty.png")
-
-        return embed
+    color: ClassVar[str] = "FFFC00"
+    icon: ClassVar[str] = "https://i.imgur.com/NARmOty.png"
@@ -1,55 +1,28 @@
-from typing import Self
+import re
+from re import Pattern
+from typing import ClassVar
 
-import httpx
-from discord_webhook import DiscordEmbed
-from httpx import Response
-from loguru import logger
+from .service import Service
 
 
-class Venmo:
+class Venmo(Service):
     """
     Class to integrate with Venmo and build objects specific to the
     Venmo platform.
     """
 
-    def IsUserAvailable(self: Self, username: str) -> bool:
-        """Determine if a Venmo username is available."""
+    name: ClassVar[str] = "Venmo"
+    prefix: ClassVar[str] = "VENMO"
 
-        status: int | None = None
+    # Venmo returns HTTP 404 (Not Found) for non-existent accounts,
+    # and HTTP 200 (Success) for existing accounts.
+    url: ClassVar[str] = "https://venmo.com/u/{username}"
+    profile: ClassVar[str] = "https://venmo.com/u/{username}"
+    follow_redirects: ClassVar[bool] = True
 
-        try:
-            res: Response = httpx.get(
-                f"https://venmo.com/u/{username}", follow_redirects=True
-            )
-            status = res.status_code
+    # Usernames are 5-30 letters, numbers, hyphens, or underscores, and
+    # are case-insensitive.
+    pattern: ClassVar[Pattern] = re.compile(r"[a-z0-9_-]{5,30}")
 
-            logger.trace(f"HTTP {status} GET {res.url}: {res.text}")
-        except Exception as e:
-            logger.opt(exception=e).error(
-                f"Failed to determine availability of Venmo username @{username}"
-            )
-
-        # Venmo returns HTTP 404 (Not Found) for non-existent accounts,
-        # and HTTP 200 (Success) for existing accounts.
-        if status:
-            if status == 404:
-                logger.success(f"Venmo username @{username} is available")
-
-                return True
-            elif status == 200:
-                logger.info(f"Fetched Venmo user @{username}, username is unavailable")
-
-        return False
-
-    def BuildEmbed(self: Self, username: str) -> DiscordEmbed:
-        """Build a Discord embed object for an available Venmo username."""
-
-        embed: DiscordEmbed = DiscordEmbed()
-
-        embed.set_description(
-            f"Venmo username [@{username}](https://venmo.com/u/{username}) is currently available."
-        )
-        embed.set_color("008CFF")
-        embed.set_footer(text="Venmo", icon_url="https://i.imgur.com/F2Vsv73.png")
-
-        return embed
+    color: ClassVar[str] = "008CFF"
+    icon: ClassVar[str] = "https://i.imgur.com/F2Vsv73.png"
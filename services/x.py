@@ -1,49 +1,73 @@
 import json
-from typing import Any, Self
+import re
+from re import Pattern
+from typing import TYPE_CHECKING, Any, ClassVar, Self
 
-import httpx
-from bs4 import BeautifulSoup
-from discord_webhook import DiscordEmbed
-from httpx import Response
 from loguru import logger
 
+from handlers import profiler, results
 
-class X:
+from .service import Service
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+    from httpx import Response
+
+# Opening tag of the script containing the page's Next.js data.
+NEXT_DATA: Pattern = re.compile(r'<script[^>]*\bid="__NEXT_DATA__"[^>]*>')
+
+# The only value of the Next.js data required to determine availability.
+HAS_RESULTS: Pattern = re.compile(r'"hasResults"\s*:\s*(true|false|null)')
+
+
+class X(Service):
     """
     Class to integrate with X and build objects specific to the
     X platform.
     """
 
-    def IsUserAvailable(self: Self, username: str) -> bool:
-        """Determine if a X username is available."""
+    name: ClassVar[str] = "X"
+    prefix: ClassVar[str] = "X"
 
-        data: dict[str, Any] = {}
+    # Availability is determined from the syndication timeline rather
+    # than the HTTP status, see IsUserAvailable.
+    url: ClassVar[str] = (
+        "https://syndication.twitter.com/srv/timeline-profile/screen-name/{username}"
+    )
+    profile: ClassVar[str] = "https://x.com/{username}"
 
-        try:
-            res: Response = httpx.get(
-                f"https://syndication.twitter.com/srv/timeline-profile/screen-name/{username}"
-            )
+    # Usernames are 5-15 letters, numbers, or underscores which cannot
+    # contain "twitter" or "admin", and are case-insensitive.
+    pattern: ClassVar[Pattern] = re.compile(r"(?!.*(?:twitter|admin))[a-z0-9_]{5,15}")
 
-            res.raise_for_status()
+    http2: ClassVar[bool] = True
 
-            logger.trace(res.text)
+    color: ClassVar[str] = "1D9BF0"
+    icon: ClassVar[str] = "https://i.imgur.com/hZbC8my.png"
 
-            if not res.text:
-                raise ValueError("response body is null")
+    async def IsUserAvailable(self: Self, username: str) -> bool | None:
+        """Determine if a X username is available."""
+
+        found: bool | None = None
 
-            parser: BeautifulSoup = BeautifulSoup(res.text, "html.parser")
-            script: str = parser.find("script", attrs={"id": "__NEXT_DATA__"}).string
+        try:
+            async with self.GetClient(username).stream(
+                "GET", self.Format(self.url, username)
+            ) as res:
+                results.Note(status=res.status_code)
 
-            logger.trace(script)
+                res.raise_for_status()
 
-            data = json.loads(script)
-            data = data["props"]["pageProps"]["contextProvider"]
+                with profiler.Measure(self.prefix, "extract"):
+                    found = await self.ExtractResults(res)
         except Exception as e:
+            results.Note(outcome="error")
+
             logger.opt(exception=e).error(
                 f"Failed to determine availability of X username @{username}"
             )
 
-            return False
+            return None
 
         # TODO: Due to limitations of this unsupported API, usernames
         # held by suspended accounts will report as available.
@@ -53,26 +77,73 @@ class X:
         # is to be lifted, we can avoid the API entirely and instead
         # scrape the empty_state_header_text from profile pages.
         # https://x.com/elonmusk/status/1674865731136020505
-        results: bool | None = data.get("hasResults")
-
-        if not results:
-            logger.success(f"X username @{username} is available")
+        if not found:
+            logger.success("X username @{} is available", username)
 
             return True
 
-        logger.info(f"Fetched X user @{username}, username is unavailable")
+        logger.info("Fetched X user @{}, username is unavailable", username)
 
         return False
 
-    def BuildEmbed(self: Self, username: str) -> DiscordEmbed:
-        """Build a Discord embed object for an available X username."""
+    async def ExtractResults(self: Self, res: "Response") -> bool | None:
+        """
+        Extract the hasResults value of the page's __NEXT_DATA__ script from
+        a streamed response, without building a DOM or decoding the entire
+        payload. Reading stops as soon as the value has been found.
+        """
+
+        buffer: str = ""
+        start: int | None = None
+        offset: int = 0
+
+        async for chunk in res.aiter_text():
+            buffer += chunk
+
+            if start is None:
+                # Resume the search slightly before the new chunk in case
+                # the script tag spans a chunk boundary.
+                if not (match := NEXT_DATA.search(buffer, offset)):
+                    offset = max(len(buffer) - 256, 0)
+
+                    continue
+
+                start = match.end()
+                offset = start
+
+            if match := HAS_RESULTS.search(buffer, offset):
+                logger.trace("Extracted {} from {}", match.group(0), res.url)
+
+                return match.group(1) == "true"
+
+            if (end := buffer.find("</script>", start)) != -1:
+                data: dict[str, Any] = json.loads(buffer[start:end])
+
+                return data["props"]["pageProps"]["contextProvider"].get("hasResults")
+
+            offset = max(len(buffer) - 64, start)
+
+        if not buffer:
+            raise ValueError("response body is null")
+
+        logger.debug("Failed to extract __NEXT_DATA__ from {}, parsing page", res.url)
+
+        with profiler.Measure(self.prefix, "parse"):
+            return self.ParseResults(buffer)
+
+    def ParseResults(self: Self, html: str) -> bool | None:
+        """
+        Parse the hasResults value from a complete page. This is a fallback
+        for when the shape of the page changes and targeted extraction fails.
+        """
+
+        from bs4 import BeautifulSoup
+
+        parser: BeautifulSoup = BeautifulSoup(html, "html.parser")
+        script: str = parser.find("script", attrs={"id": "__NEXT_DATA__"}).string
 
-        embed: DiscordEmbed = DiscordEmbed()
+        logger.trace(script)
 
-        embed.set_description(
-            f"X username [@{username}](https://x.com/{username}) is currently available."
-        )
-        embed.set_color("1D9BF0")
-        embed.set_footer(text="X", icon_url="https://i.imgur.com/hZbC8my.png")
+        data: dict[str, Any] = json.loads(script)
 
-        return embed
+        return data["props"]["pageProps"]["contextProvider"].get("hasResults")